@@ -5,8 +5,10 @@ vary hdf5-files
 - content: constant set, rising, random
     - rising is typical for timestamp-dataset
     - constant is typical for regulated voltage-output during emulation
-- compression: none, gzip, lzf
-- duplication: inner, outer
+- compression: none, gzip, lzf, blosc (zstd & lz4 + bitshuffle), zstd
+  - blosc & zstd are provided by hdf5plugin (pip install hdf5plugin)
+- duplication: inner, outer, virtual
+  - virtual stores the payload once and links it into each entity (hdf5 virtual dataset)
 - outer compression of files
 
 Results in MB:
@@ -27,50 +29,74 @@ randm lzf   229     229
 
 """
 
+import gc
 from pathlib import Path
 
 import h5py
+import hdf5plugin
 import numpy as np
 from shepherd_core.logger import log
 
+
+def pick_chunk(size: int, dtype: type = np.uint32, target_bytes: int = 1 << 20) -> tuple[int]:
+    """Derive chunk-shape of ~1 MiB (matches default chunk-cache of hdf5)."""
+    elements = target_bytes // np.dtype(dtype).itemsize
+    return (min(size, max(10_000, elements)),)
+
+
 duration_s = 60
 samplerate_sps = 100_000
 sample_interval_ns = round(10**9 // samplerate_sps)
+samples_n = int(samplerate_sps * duration_s)
+# generate in target-dtype (u4) -> avoids int64/float64 temporaries & casting on write
+# factories -> only one content is alive at a time (lower peak memory)
 contents: dict = {
-    "rising": np.arange(0.0, duration_s * 1e6, sample_interval_ns / 1e3),  # usec
-    "constant": np.linspace(3 * 10**6, 3 * 10**6, int(samplerate_sps * duration_s)),
-    "random": np.random.default_rng().integers(0, 2**32 - 1, int(samplerate_sps * duration_s)),
+    "rising": lambda: (
+        np.arange(samples_n, dtype=np.uint32) * np.uint32(sample_interval_ns // 10**3)
+    ),
+    # ⤷ timestamps in us, integer-index times stride guarantees exactly samples_n entries
+    "constant": lambda: np.full(samples_n, 3 * 10**6, dtype=np.uint32),
+    "random": lambda: np.random.default_rng().integers(0, 2**32 - 1, samples_n, dtype=np.uint32),
 }
-compressions: dict = {
-    "none": None,
-    "gzip": "gzip",
-    "lzf": "lzf",
+compressions: dict = {  # kwargs for create_dataset()
+    "none": {},
+    "gzip": {"compression": "gzip"},
+    "lzf": {"compression": "lzf"},
+    "blosc_zstd": hdf5plugin.Blosc(cname="zstd", clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE),
+    "blosc_lz4_bitshuffle": hdf5plugin.Blosc(
+        cname="lz4", clevel=9, shuffle=hdf5plugin.Blosc.BITSHUFFLE
+    ),
+    "zstd": hdf5plugin.Zstd(clevel=9),
 }
 duplication: int = 10
 path_here = Path(__file__).parent
+h5_kwargs: dict = {  # newest file-format, no file-locking, larger chunk-cache
+    "libver": "latest",
+    "locking": False,
+    "rdcc_nbytes": 16 * (1 << 20),
+    "rdcc_nslots": 1_000_003,
+}
 
-for content_name, content in contents.items():
+for content_name, content_factory in contents.items():
+    content_u4 = np.ascontiguousarray(content_factory(), dtype="u4")
+    chunks = pick_chunk(content_u4.shape[0])
     for compression_name, compression in compressions.items():
         # inner duplication
         file_path = path_here / f"{content_name}_{compression_name}_{duplication}in1.h5"
         log.info(f"Generating {file_path}")
-        h5file = h5py.File(file_path, "w")
+        h5file = h5py.File(file_path, "w", **h5_kwargs)
         grp_data = h5file.create_group("data")
 
         for _i in range(duplication):
             ds_name = f"current{_i}"
-            grp_data.create_dataset(
+            ds_data = grp_data.create_dataset(
                 ds_name,
-                shape=(0,),
-                dtype="u4",
-                maxshape=(None,),
-                chunks=(10_000,),
-                compression=compression,
+                data=content_u4,  # allocate & write in one go
+                chunks=chunks,
+                **compression,
             )
-            grp_data[ds_name].attrs["unit"] = "A"
-            grp_data[ds_name].attrs["description"] = "current [A] = value * gain + offset"
-            grp_data[ds_name].resize((content.shape[0],))
-            grp_data[ds_name][:] = content[:]
+            ds_data.attrs["unit"] = "A"
+            ds_data.attrs["description"] = "current [A] = value * gain + offset"
         h5file.close()
 
         # outer duplication
@@ -78,18 +104,38 @@ for content_name, content in contents.items():
         for _i in range(duplication):
             file_path = path_here / f"{content_name}_{compression_name}_entity{_i}.h5"
             log.info(f"Generating {file_path}")
-            h5file = h5py.File(file_path, "w")
+            h5file = h5py.File(file_path, "w", **h5_kwargs)
             grp_data = h5file.create_group("data")
-            grp_data.create_dataset(
+            ds_data = grp_data.create_dataset(
                 ds_name,
-                shape=(0,),
-                dtype="u4",
-                maxshape=(None,),
-                chunks=(10_000,),
-                compression=compression,
+                data=content_u4,  # allocate & write in one go
+                chunks=chunks,
+                **compression,
             )
-            grp_data[ds_name].attrs["unit"] = "A"
-            grp_data[ds_name].attrs["description"] = "current [A] = value * gain + offset"
-            grp_data[ds_name].resize((content.shape[0],))
-            grp_data[ds_name][:] = content[:]
+            ds_data.attrs["unit"] = "A"
+            ds_data.attrs["description"] = "current [A] = value * gain + offset"
             h5file.close()
+
+        # virtual duplication -> payload is stored once, entities only link to it (VDS)
+        source_name = f"{content_name}_{compression_name}_source.h5"
+        file_path = path_here / source_name
+        log.info(f"Generating {file_path}")
+        h5file = h5py.File(file_path, "w", **h5_kwargs)
+        grp_data = h5file.create_group("data")
+        grp_data.create_dataset(ds_name, data=content_u4, chunks=chunks, **compression)
+        h5file.close()
+        layout = h5py.VirtualLayout(shape=content_u4.shape, dtype="u4")
+        layout[:] = h5py.VirtualSource(source_name, f"data/{ds_name}", shape=content_u4.shape)
+        # ⤷ relative source-path gets resolved next to the virtual file
+        for _i in range(duplication):
+            file_path = path_here / f"{content_name}_{compression_name}_virtual{_i}.h5"
+            log.info(f"Generating {file_path}")
+            h5file = h5py.File(file_path, "w", **h5_kwargs)
+            grp_data = h5file.create_group("data")
+            ds_data = grp_data.create_virtual_dataset(ds_name, layout)
+            ds_data.attrs["unit"] = "A"
+            ds_data.attrs["description"] = "current [A] = value * gain + offset"
+            h5file.close()
+
+    del content_u4
+    gc.collect()
@@ -12,13 +12,14 @@
 
 """
 
+import logging
+from collections.abc import Collection
 from collections.abc import Mapping
 from collections.abc import Sequence
 from pathlib import Path
 from typing import Annotated
 
 from pydantic import Field
-from pydantic import validate_call
 from shepherd_core.data_models.base.shepherd import ShpModel
 from shepherd_core.data_models.content import EnergyEnvironment
 from shepherd_core.data_models.content import EnergyProfile
@@ -61,50 +62,101 @@ class Experiment(ShpModel):
     target_configs: Annotated[list[TargetConfig], Field(min_length=1, max_length=128)]
 
 
+class LazyDump:
+    """Defer serialization of a model until the log-record is actually emitted.
+
+    Pretty-printing is only done in debug-mode, compact json is considerably faster.
+    """
+
+    __slots__ = ("model",)
+
+    def __init__(self, model: ShpModel) -> None:
+        self.model = model
+
+    def __str__(self) -> str:  # hot: runs once per emitted record
+        indent = 3 if log.isEnabledFor(logging.DEBUG) else None
+        return self.model.model_dump_json(indent=indent, exclude_unset=True, exclude_defaults=True)
+
+
 class TargetConfigBuilder:
-    @validate_call
+    """Chained construction of TargetConfigs.
+
+    Arguments are only type-checked (no pydantic validate_call), as the models
+    passed in are already validated instances.
+    """
+
     def __init__(
         self,
         target_IDs: Sequence[int],
         firmware_default: Firmware | None = None,
         energy_profile_default: EnergyProfile | None = None,
     ) -> None:
+        if firmware_default is not None and not isinstance(firmware_default, Firmware):
+            raise TypeError("firmware_default must be of type Firmware")
+        if energy_profile_default is not None and not isinstance(
+            energy_profile_default, EnergyProfile
+        ):
+            raise TypeError("energy_profile_default must be of type EnergyProfile")
         self.target_IDs: list[int] = list(target_IDs)
-        self.firmwares: list[Firmware | None] = len(target_IDs) * [firmware_default]
-        self.profiles: list[EnergyProfile | None] = len(target_IDs) * [energy_profile_default]
+        self._n: int = len(self.target_IDs)
+        self._idx: dict[int, int] = {tid: i for i, tid in enumerate(self.target_IDs)}
+        # ⤷ ID -> position, .with_*() only visit the requested IDs
+        self.firmwares: list[Firmware | None] = self._n * [None]
+        self.profiles: list[EnergyProfile | None] = self._n * [None]
+        self._firmware_default = firmware_default
+        self._profile_default = energy_profile_default
+        # ⤷ defaults fill the gaps during .build()
         # TODO: other fields missing
         # TODO: use all IDs if None is provided?
         # TODO: either provide defaults here OR in the .with_() function
         # TODO: use static 3V profile if None is provided?
         # TODO: target_ID is available, so default firmware could be derived from target
 
-    @validate_call
-    def with_firmware(self, firmware: Firmware, target_IDs: Sequence[int] | None = None) -> Self:
+    def with_firmware(self, firmware: Firmware, target_IDs: Collection[int] | None = None) -> Self:
+        if not isinstance(firmware, Firmware):
+            raise TypeError("firmware must be of type Firmware")
         if target_IDs is None:
-            target_IDs = self.target_IDs
-        for i in range(len(self.target_IDs)):
-            if self.target_IDs[i] in target_IDs:
+            self.firmwares = self._n * [firmware]
+            return self
+        for tid in target_IDs:
+            i = self._idx.get(tid)
+            if i is not None:
                 self.firmwares[i] = firmware
         return self
 
-    @validate_call
     def with_eenv(self, eenv: EnergyEnvironment, mapping: Mapping[int, int] | None = None) -> Self:
+        if not isinstance(eenv, EnergyEnvironment):
+            raise TypeError("eenv must be of type EnergyEnvironment")
         if mapping is None:
-            mapping = {id_: iter_ for (iter_, id_) in enumerate(self.target_IDs)}
+            self.profiles = [eenv.get_profile(iter_) for iter_ in range(self._n)]
+            return self
 
-        for iter_, id_ in enumerate(self.target_IDs):
-            if id_ in mapping:
-                self.profiles[iter_] = eenv[mapping.get(id_)]
+        for id_, index in mapping.items():
+            iter_ = self._idx.get(id_)
+            if iter_ is not None:
+                self.profiles[iter_] = eenv.get_profile(index)
         return self
 
-    def build(self) -> list[TargetConfig]:
+    def build(self, *, validate: bool = False) -> list[TargetConfig]:
+        """Generate the configs.
+
+        Inputs are validated models (type-checked by the .with_*()-methods), so by default
+        the configs get constructed without running pydantic-validation again.
+        """
+        fw_default = self._firmware_default
+        ep_default = self._profile_default
+        if not validate and ep_default is None and None in self.profiles:
+            raise ValueError("Every target needs an EnergyProfile (see .with_eenv())")
+        constructor = TargetConfig if validate else TargetConfig.model_construct
         return [
-            TargetConfig(
-                target_ID=self.target_IDs[i],
-                firmware=self.firmwares[i],
-                energy_profile=self.profiles[i],
+            constructor(
+                target_ID=tid,
+                firmware=fw_default if firmware is None else firmware,
+                energy_profile=ep_default if profile is None else profile,
+            )
+            for tid, firmware, profile in zip(
+                self.target_IDs, self.firmwares, self.profiles, strict=True
             )
-            for i in range(len(self.target_IDs))
         ]
 
 
@@ -146,11 +198,7 @@ if __name__ == "__main__":
         .with_eenv(dummy_eenv1)
         .build()
     )
-    log.info(
-        Experiment(target_configs=cfgs).model_dump_json(
-            indent=3, exclude_unset=True, exclude_defaults=True
-        )
-    )
+    log.info("%s", LazyDump(Experiment(target_configs=cfgs)))
     log.info("---\n\n")
 
     log.info("Mixed Environments:")
@@ -161,11 +209,7 @@ if __name__ == "__main__":
         .with_eenv(dummy_eenv2, mapping={13: 0, 14: 1})
         .build()
     )
-    log.info(
-        Experiment(target_configs=cfgs_2).model_dump_json(
-            indent=3, exclude_unset=True, exclude_defaults=True
-        )
-    )
+    log.info("%s", LazyDump(Experiment(target_configs=cfgs_2)))
     log.info("---\n\n")
 
     log.info("Complex/Manual Configuration:")
@@ -175,9 +219,5 @@ if __name__ == "__main__":
         TargetConfig(target_ID=13, firmware=dummy_fw1, energy_profile=dummy_profiles[7]),
         TargetConfig(target_ID=22, firmware=dummy_fw1, energy_profile=dummy_profiles[3]),
     ]
-    log.info(
-        Experiment(target_configs=cfgs_3).model_dump_json(
-            indent=3, exclude_unset=True, exclude_defaults=True
-        )
-    )
+    log.info("%s", LazyDump(Experiment(target_configs=cfgs_3)))
     log.info("---\n\n")
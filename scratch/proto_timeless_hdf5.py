@@ -12,8 +12,10 @@ Example Calculation:
 - even the random-walk seems to shrink by x3.5
 """
 
+import math
 from pathlib import Path
 
+import numpy as np
 from shepherd_core.data_models.base.calibration import CalibrationPair
 from shepherd_core.data_models.base.calibration import CalibrationSeries
 from shepherd_core.data_models.content.enum_datatypes import Compression
@@ -22,6 +24,8 @@ from shepherd_core.reader import Reader
 from shepherd_core.writer import Writer
 
 path_demo = Path(r".\synthetic_static")
+block_bytes_target = 8 * 2**20
+# ⤷ copy in blocks -> bounded memory, each chunk gets touched once
 
 file_paths = list(path_demo.rglob("*.h5"))
 
@@ -30,13 +34,18 @@ for path_inp in file_paths[3:4]:
     print(path_inp)
     print(f"Size-Inp: {path_inp.stat().st_size}")
     with (
-        Reader(path_inp, verbose=False) as reader,
+        Reader(path_inp, verbose=False, chunk_cache_bytes=256 * 2**20) as reader,
         Writer(
             file_path=path_out,
-            compression=Compression.gzip1,
+            compression=Compression.blosc_lz4,
+            # ⤷ needs hdf5plugin, gzip1 is the slower (but bbone-compatible) option
             mode="harvester",
             datatype=EnergyDType.ivsample,
             window_samples=0,
+            chunk_samples=250_000,
+            # ⤷ 1 MiB chunks (u4) for bulk-copies
+            chunk_cache_bytes=16 * 2**20,
+            timeless=True,
             cal_data=CalibrationSeries(
                 # sheep can skip scaling if cal is ideal (applied here)
                 voltage=CalibrationPair(gain=1e-6, offset=0),
@@ -46,12 +55,26 @@ for path_inp in file_paths[3:4]:
         ) as writer,
     ):
         writer.store_hostname(reader.get_hostname())
+        writer.store_time_start(int(reader.ds_time[0]))
         size_new = reader.samples_n
 
         writer.ds_voltage.resize((size_new,))
         writer.ds_current.resize((size_new,))
 
-        writer.ds_current[:size_new] = reader.ds_current[:size_new]
-        writer.ds_voltage[:size_new] = reader.ds_voltage[:size_new]
+        # block is a multiple of source- & destination-chunks
+        chunk_dst = writer.ds_voltage.chunks[0]
+        chunk_src = (reader.ds_voltage.chunks or (chunk_dst,))[0]
+        block = math.lcm(chunk_src, chunk_dst)
+        block *= max(1, block_bytes_target // (block * writer.ds_voltage.dtype.itemsize))
+        buffer = np.empty(block, dtype=writer.ds_voltage.dtype)
+        for start in range(0, size_new, block):
+            stop = min(start + block, size_new)
+            sel_buf = np.s_[: stop - start]
+            for ds_src, ds_dst in [
+                (reader.ds_voltage, writer.ds_voltage),
+                (reader.ds_current, writer.ds_current),
+            ]:
+                ds_src.read_direct(buffer, np.s_[start:stop], sel_buf)
+                ds_dst.write_direct(buffer, sel_buf, np.s_[start:stop])
 
     print(f"Size-Out: {path_out.stat().st_size}")
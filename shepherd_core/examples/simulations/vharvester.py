@@ -15,8 +15,10 @@ E_out = 17.811 mWs -> mppt_opt
 
 """
 
+import multiprocessing
 import os
 import sys
+from functools import partial
 from pathlib import Path
 
 from shepherd_core.data_models.content import VirtualHarvesterConfig
@@ -34,9 +36,6 @@ sim_duration = min(32, DURATION_MAX)
 file_ivonne = Path(__file__).parents[3] / "shepherd_data/examples/jogging_10m.iv"
 file_ivcurve = Path(__file__).parent / "jogging_ivcurve.h5"
 
-if not file_ivonne.exists():
-    raise FileNotFoundError("Input-File not found - check path")
-
 hrv_list = [
     "cv20",
     # ⤷ fails due to lower solar voltage
@@ -52,30 +51,42 @@ hrv_list = [
 
 save_files: bool = True
 
-# convert IVonne to IVCurve
-if not file_ivcurve.exists():
-    with ivonne.Reader(file_ivonne) as db:
-        db.convert_2_ivsurface(file_ivcurve, duration_s=sim_duration)
-
-# Input Statistics
-with Reader(file_ivcurve, verbose=False) as file:
-    window_size = file.get_window_samples()
-    I_in_max = 0.0
-    for _t, _v, _i in file.read():
-        I_in_max = max(I_in_max, _i.max())
-    print(
-        f"Input-file: \n"
-        f"\tE_in = {file.energy() * 1e3:.3f} mWs (not representative)\n"
-        f"\tI_in_max = {I_in_max * 1e3:.3f} mA\n"
-        f"\twindow_size = {window_size} n\n",
-    )
 
-# Simulation
-for hrv_name in hrv_list:
-    file_output = file_ivcurve.with_stem(file_ivcurve.stem + "_" + hrv_name) if save_files else None
+def run_harvester(hrv_name: str, path_input: Path) -> tuple[str, float]:
+    """Simulate a single harvester - each worker opens its own file-handle."""
+    file_output = path_input.with_stem(path_input.stem + "_" + hrv_name) if save_files else None
     E_out_Ws = simulate_harvester(
         config=VirtualHarvesterConfig(name=hrv_name),
-        path_input=file_ivcurve,
+        path_input=path_input,
         path_output=file_output,
     )
-    print(f"E_out = {E_out_Ws * 1e3:.3f} mWs -> {hrv_name}")
+    return hrv_name, E_out_Ws
+
+
+if __name__ == "__main__":
+    if not file_ivonne.exists():
+        raise FileNotFoundError("Input-File not found - check path")
+
+    # convert IVonne to IVCurve
+    if not file_ivcurve.exists():
+        with ivonne.Reader(file_ivonne) as db:
+            db.convert_2_ivsurface(file_ivcurve, duration_s=sim_duration)
+
+    # Input Statistics
+    with Reader(file_ivcurve, verbose=False) as file:
+        window_size = file.get_window_samples()
+        I_in_max = 0.0
+        for _t, _v, _i in file.read():
+            I_in_max = max(I_in_max, _i.max())
+        print(
+            f"Input-file: \n"
+            f"\tE_in = {file.energy() * 1e3:.3f} mWs (not representative)\n"
+            f"\tI_in_max = {I_in_max * 1e3:.3f} mA\n"
+            f"\twindow_size = {window_size} n\n",
+        )
+
+    # Simulation - harvesters are independent -> one process per algorithm
+    with multiprocessing.Pool(min(len(hrv_list), os.cpu_count() or 1)) as pool:
+        results = pool.map(partial(run_harvester, path_input=file_ivcurve), hrv_list)
+    for hrv_name, E_out_Ws in results:
+        print(f"E_out = {E_out_Ws * 1e3:.3f} mWs -> {hrv_name}")
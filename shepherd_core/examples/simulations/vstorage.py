@@ -11,9 +11,12 @@ Some general Notes:
 import multiprocessing
 import os
 import sys
+from collections.abc import Callable
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
 
+import numpy as np
 from pydantic import PositiveFloat
 from pydantic import validate_call
 from shepherd_core.data_models.content.virtual_storage_config import VirtualStorageConfig
@@ -38,14 +41,32 @@ def get_models(
     SoC_init: soc_t, config: VirtualStorageConfig, dt_s: PositiveFloat
 ) -> list[ModelStorage]:
     """Models to include in experiments."""
-    return [
-        ModelKiBaM(SoC_init=SoC_init, cfg=config, dt_s=dt_s),
-        ModelKiBaMPlus(SoC_init=SoC_init, cfg=config, dt_s=dt_s),
-        ModelKiBaMSimple(SoC_init=SoC_init, cfg=config, dt_s=dt_s, optimize_clamp=True),
-        ModelKiBaMSimple(SoC_init=SoC_init, cfg=config, dt_s=dt_s, interpolate=True),
-        VirtualStorageModel(SoC_init=SoC_init, cfg=config, dt_s=dt_s),
-        ModelShpCap(SoC_init=SoC_init, cfg=config, dt_s=dt_s),
+    kwargs = {"SoC_init": SoC_init, "cfg": config, "dt_s": dt_s}
+    factories = [
+        partial(ModelKiBaM, **kwargs),
+        partial(ModelKiBaMPlus, **kwargs),
+        partial(ModelKiBaMSimple, **kwargs, optimize_clamp=True),
+        partial(ModelKiBaMSimple, **kwargs, interpolate=True),
+        partial(VirtualStorageModel, **kwargs),
+        partial(ModelShpCap, **kwargs),
     ][1:5]
+    # ⤷ selection happens before construction -> unused models are never instantiated
+    return [factory() for factory in factories]
+
+
+class PulseTicker:
+    """Integer pulse-phase replacing a float modulo of the timestamp per step.
+
+    The phase is derived from the sample-index of the simulator (run with pass_index=True),
+    so there is no state to carry over from one model-run to the next.
+    """
+
+    def __init__(self, period_s: float, duration_s: float, dt_s: float) -> None:
+        self.n_period = max(round(period_s / dt_s), 1)
+        self.n_duty = round(duration_s / dt_s)
+
+    def is_active(self, index: int) -> bool:
+        return index % self.n_period < self.n_duty
 
 
 class CurrentPulsed:
@@ -58,18 +79,19 @@ class CurrentPulsed:
         period_pulse: PositiveFloat,
         duration_pulse: PositiveFloat,
         SoC_target: soc_t,
+        dt_s: PositiveFloat,
     ) -> None:
         self.I_pulse = I_pulse
-        self.period_pulse = period_pulse
-        self.duration_pulse = duration_pulse
         self.SoC_target = SoC_target
+        self.pulse = PulseTicker(period_pulse, duration_pulse, dt_s)
+        self._sign = (I_pulse > 0) - (I_pulse < 0)
+        # ⤷ direction is fixed -> target reached when SoC passed it in that direction
 
-    def step(self, t_s: float, SoC: float, _v: float) -> float:
-        if (self.I_pulse < 0 and SoC <= self.SoC_target) or (
-            self.I_pulse > 0 and SoC >= self.SoC_target
-        ):
+    def step(self, index: int, SoC: float, _v: float) -> float:
+        active = self.pulse.is_active(index)
+        if not active or (SoC - self.SoC_target) * self._sign >= 0:
             return 0
-        return self.I_pulse if t_s % self.period_pulse < self.duration_pulse else 0
+        return self.I_pulse
 
 
 class ResistiveChargePulsed:
@@ -82,15 +104,17 @@ class ResistiveChargePulsed:
         R_Ohm: PositiveFloat,
         period_pulse: PositiveFloat,
         duration_pulse: PositiveFloat,
+        dt_s: PositiveFloat,
     ) -> None:
         self.R_Ohm = R_Ohm
+        self.G_S = 1.0 / R_Ohm  # conductance -> multiply instead of divide per step
         self.V_target = V_target
-        self.period_pulse = period_pulse
-        self.duration_pulse = duration_pulse
+        self.pulse = PulseTicker(period_pulse, duration_pulse, dt_s)
 
-    def step(self, t_s: float, _s: float, V: float) -> float:
-        I_A = (self.V_target - V) / self.R_Ohm
-        return I_A if t_s % self.period_pulse < self.duration_pulse else 0
+    def step(self, index: int, _s: float, V: float) -> float:
+        if not self.pulse.is_active(index):
+            return 0
+        return (self.V_target - V) * self.G_S
 
 
 def experiment_current_ramp_pos(config: VirtualStorageConfig) -> None:
@@ -103,10 +127,10 @@ def experiment_current_ramp_pos(config: VirtualStorageConfig) -> None:
         dt_s=dt_s,
     )
 
-    def current_trace(t_s: float, _s: float, _v: float) -> float:
+    def current_trace(t_s: np.ndarray) -> np.ndarray:
         return 0.1 + 0.15 * t_s / duration_s  # pru-model can handle +- 268 mA
 
-    sim.run(fn=current_trace, duration_s=duration_s)
+    sim.run_vec(fn=current_trace, duration_s=duration_s)
     sim.plot(path_here, f"Experiment {config.name}, current charge ramp (positive)")
 
 
@@ -120,10 +144,10 @@ def experiment_current_ramp_neg(config: VirtualStorageConfig) -> None:
         dt_s=dt_s,
     )
 
-    def current_trace(t_s: float, _s: float, _v: float) -> float:
+    def current_trace(t_s: np.ndarray) -> np.ndarray:
         return -(0.1 + 0.14 * t_s / duration_s)  # pru-model can handle +- 268 mA
 
-    sim.run(fn=current_trace, duration_s=duration_s)
+    sim.run_vec(fn=current_trace, duration_s=duration_s)
     sim.plot(path_here, f"Experiment {config.name}, current discharge ramp (negative)")
 
 
@@ -133,13 +157,13 @@ def experiment_pulsed_discharge(config: VirtualStorageConfig) -> None:
     SoC_start = 1.0
     SoC_target = 0.0
     i_pulse = CurrentPulsed(
-        I_pulse=-0.1, period_pulse=200, duration_pulse=100, SoC_target=SoC_target
+        I_pulse=-0.1, period_pulse=200, duration_pulse=100, SoC_target=SoC_target, dt_s=dt_s
     )  # pru-model can handle +- 268 mA
     sim = StorageSimulator(
         models=get_models(SoC_start, config, dt_s),
         dt_s=dt_s,
     )
-    sim.run(fn=i_pulse.step, duration_s=min(1_000, DURATION_MAX))
+    sim.run(fn=i_pulse.step, pass_index=True, duration_s=min(1_000, DURATION_MAX))
     sim.plot(path_here, f"Experiment {config.name}, pulsed discharge .1A, 1000 s (figure_9a)")
 
 
@@ -149,13 +173,13 @@ def experiment_pulsed_charge(config: VirtualStorageConfig) -> None:
     SoC_start = 0.0
     SoC_target = 1.0
     i_pulse = CurrentPulsed(
-        I_pulse=0.1, period_pulse=200, duration_pulse=100, SoC_target=SoC_target
+        I_pulse=0.1, period_pulse=200, duration_pulse=100, SoC_target=SoC_target, dt_s=dt_s
     )  # pru-model can handle +- 268 mA
     sim = StorageSimulator(
         models=get_models(SoC_start, config, dt_s),
         dt_s=dt_s,
     )
-    sim.run(fn=i_pulse.step, duration_s=min(1_000, DURATION_MAX))
+    sim.run(fn=i_pulse.step, pass_index=True, duration_s=min(1_000, DURATION_MAX))
     sim.plot(path_here, f"Experiment {config.name}, pulsed charge .1A, 1000 s (figure_9b)")
 
 
@@ -163,12 +187,14 @@ def experiment_pulsed_resistive_charge(config: VirtualStorageConfig) -> None:
     """Charge virtual storage with a resistive constant voltage."""
     dt_s = 0.5
     SoC_start = 0.0
-    i_pulse = ResistiveChargePulsed(R_Ohm=20, V_target=4.2, period_pulse=200, duration_pulse=100)
+    i_pulse = ResistiveChargePulsed(
+        R_Ohm=20, V_target=4.2, period_pulse=200, duration_pulse=100, dt_s=dt_s
+    )
     sim = StorageSimulator(
         models=get_models(SoC_start, config, dt_s),
         dt_s=dt_s,
     )
-    sim.run(fn=i_pulse.step, duration_s=min(3_000, DURATION_MAX))
+    sim.run(fn=i_pulse.step, pass_index=True, duration_s=min(3_000, DURATION_MAX))
     sim.plot(
         path_here, f"Experiment {config.name}, pulsed resistive charge 20 Ohm to 4.2 V, 3000 s"
     )
@@ -205,10 +231,10 @@ def experiment_self_discharge() -> None:
         dt_s=dt_s,
     )
 
-    def step(_t: float, _s: float, _v: float) -> float:
+    def step(_t: np.ndarray) -> float:
         return 0
 
-    sim.run(fn=step, duration_s=min(duration.total_seconds(), DURATION_MAX))
+    sim.run_vec(fn=step, duration_s=min(duration.total_seconds(), DURATION_MAX))
     sim.plot(
         path_here,
         f"Experiment {config.name}, self-discharge, "
@@ -216,25 +242,32 @@ def experiment_self_discharge() -> None:
     )
 
 
-if __name__ == "__main__":
-    with multiprocessing.Pool() as pool:
-        pool.apply_async(experiment_self_discharge)
-
-        configs = [
-            VirtualStorageConfig.capacitor(C_uF=10e6, V_rated=4.2),  # match charge with batteries
-            VirtualStorageConfig.lipo(q_mAh=10),
-            VirtualStorageConfig.lead_acid(q_mAh=10),
-        ]
+def run_experiment(fn: Callable[..., None], *args: VirtualStorageConfig) -> None:
+    """Dispatch helper for the process-pool."""
+    fn(*args)
 
-        for cfg in configs:
-            pool.apply_async(experiment_pulsed_charge, args=(cfg,))
-            pool.apply_async(experiment_pulsed_discharge, args=(cfg,))
-            pool.apply_async(experiment_current_ramp_pos, args=(cfg,))
-            pool.apply_async(experiment_current_ramp_neg, args=(cfg,))
 
-        for cfg in configs[0:2]:
-            pool.apply_async(experiment_pulsed_resistive_charge, args=(cfg,))
-            pool.apply_async(experiment_resistive_load, args=(cfg,))
+if __name__ == "__main__":
+    configs = [
+        VirtualStorageConfig.capacitor(C_uF=10e6, V_rated=4.2),  # match charge with batteries
+        VirtualStorageConfig.lipo(q_mAh=10),
+        VirtualStorageConfig.lead_acid(q_mAh=10),
+    ]
+    tasks: list[tuple] = [(experiment_self_discharge,)]
+    for cfg in configs:
+        tasks += [
+            (experiment_pulsed_charge, cfg),
+            (experiment_pulsed_discharge, cfg),
+            (experiment_current_ramp_pos, cfg),
+            (experiment_current_ramp_neg, cfg),
+        ]
+    for cfg in configs[0:2]:
+        tasks += [
+            (experiment_pulsed_resistive_charge, cfg),
+            (experiment_resistive_load, cfg),
+        ]
 
-        pool.close()
-        pool.join()
+    with multiprocessing.Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+        # ⤷ never spawn more workers than tasks
+        # single batched submission, also propagates exceptions of workers
+        pool.starmap(run_experiment, tasks, chunksize=1)
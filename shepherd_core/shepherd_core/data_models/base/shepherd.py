@@ -3,6 +3,9 @@
 import hashlib
 import pickle
 from collections.abc import Generator
+from collections.abc import Mapping
+from functools import cache
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 from typing import final
@@ -11,6 +14,7 @@ import ryaml
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import model_validator
+from pydantic_core import to_json
 from typing_extensions import Self
 
 from shepherd_core.logger import log
@@ -48,6 +52,24 @@ def path_to_str(old: dict) -> dict:
     return new
 
 
+@cache
+def _known_fields(model: type[BaseModel]) -> frozenset[str]:
+    """Field-names & aliases of a model - static after class-creation, so only built once."""
+    fields = model.model_fields
+    return frozenset(fields.keys() | {v.alias for v in fields.values()})
+
+
+@cache
+def _cached_properties(model: type[BaseModel]) -> frozenset[str]:
+    """Names of all cached properties of a model (incl. inherited) - only collected once."""
+    return frozenset(
+        name
+        for klass in model.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property)
+    )
+
+
 class ShpModel(BaseModel):
     """Pre-configured Pydantic Base-Model (specifically for shepherd).
 
@@ -117,11 +139,7 @@ class ShpModel(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def __alert_extra_field__(cls, values: dict[str, Any]) -> dict[str, Any]:
-        if isinstance(values, dict) and (
-            extra_fields := values.keys()
-            - cls.model_fields.keys()
-            - {v.alias for v in cls.model_fields.values()}
-        ):
+        if isinstance(values, dict) and (extra_fields := values.keys() - _known_fields(cls)):
             if only_warn_extra_fields:
                 log.warning("%s is ignoring extra fields: %s", cls.__name__, extra_fields)
             else:
@@ -199,6 +217,24 @@ class ShpModel(BaseModel):
             raise ValueError("Model in file does not match the actual Class")
         return cls(**shp_wrap.parameters)
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        model = super().model_copy(update=update, deep=deep)
+        if update:
+            # content changed -> drop memoized values (like the hash), copied with __dict__
+            for name in _cached_properties(type(self)):
+                model.__dict__.pop(name, None)
+        return model
+
+    @cached_property
+    def _hash(self) -> str:
+        """Memoized for .get_hash() - model is frozen.
+
+        JSON is encoded by pydantic-core (rust), which is faster and more compact than
+        the repr of the python-dict. Field-order is fixed by the model-definition,
+        bytes get base64-encoded as they are not necessarily valid utf-8.
+        """
+        return hashlib.sha3_224(to_json(self.model_dump(), bytes_mode="base64")).hexdigest()
+
     @final
     def get_hash(self) -> str:
-        return hashlib.sha3_224(str(self.model_dump()).encode("utf-8")).hexdigest()
+        return self._hash
@@ -37,10 +37,14 @@ TODO: find a proper solution for slicing repetitions (consider slice-length)
       or get rid of funky behavior (warning is emitted ATM)
 """
 
+import errno
+import os
 import shutil
-from collections.abc import Mapping
 from collections.abc import Sequence
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import cycle
+from itertools import islice
 from pathlib import Path
 from typing import Annotated
 from typing import Any
@@ -52,7 +56,7 @@ from pydantic import Field
 from pydantic import NonNegativeFloat
 from pydantic import PositiveFloat
 from pydantic import model_validator
-from pydantic import validate_call
+from pydantic_core import to_json
 from typing_extensions import Self
 
 from shepherd_core.data_models.base.content import ContentModel
@@ -65,6 +69,54 @@ from shepherd_core.testbed_client import tb_client
 
 from .enum_datatypes import EnergyDType
 
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy file-content (no metadata).
+
+    copy_file_range() allows reflinks (XFS, Btrfs) and server-side copies (NFS),
+    shutil.copyfile() is the fallback for unsupported platforms & filesystems.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+        except OSError as xcpt:
+            if xcpt.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+        else:
+            return
+    shutil.copyfile(src, dst)
+
+
+def _list_directory(path: Path) -> dict[str, os.DirEntry]:
+    """Map names to entries of a directory, missing directories are empty."""
+    try:
+        with os.scandir(path) as scan:
+            return {entry.name: entry for entry in scan}
+    except OSError:  # missing or not a directory
+        return {}
+
+
+def _path_state(entries: dict[str, os.DirEntry], path: Path) -> tuple[bool, bool]:
+    """Determine (exists, is_file) of a path, same semantics as Path.exists() / .is_file().
+
+    The directory-listing is only a fast path for regular entries. Unlisted names
+    (i.e. differing case on case-insensitive filesystems) and symlinks
+    (possibly broken) are asked from the filesystem.
+    """
+    entry = entries.get(path.name)
+    if entry is None or entry.is_symlink():
+        exists = path.exists()
+        return exists, exists and path.is_file()
+    return True, entry.is_file()
+
 
 @final
 class EnergyProfile(ShpModel):
@@ -101,8 +153,9 @@ class EnergyProfile(ShpModel):
             output_path.parent.mkdir(exist_ok=True, parents=True)
             file_path = output_path
         # TODO: offer both, move and copy?
-        shutil.copy(self.data_path, file_path)
-        return self.model_copy(deep=True, update={"data_path": file_path})
+        _copy_file(self.data_path, file_path)
+        # ⤷ skips copying permissions & uses zero-copy syscalls when possible
+        return self.model_copy(update={"data_path": file_path})
 
     def check(self) -> bool:
         """Check validity of Energy-Profile.
@@ -115,30 +168,29 @@ class EnergyProfile(ShpModel):
         if not self.data_path.is_file():
             log.error(f"EnergyProfile is not a file ({self.data_path}).")
             return False
-        try:
-            with Reader(self.data_path, verbose=False) as reader:
-                if self.duration != reader.runtime_s:
-                    log.error(
-                        "EnergyProfile duration does not match runtime of file "
-                        f"({self.duration} vs {reader.runtime_s} in {self.data_path})."
-                    )
-                    return False
-                if self.valid != reader.is_valid():
-                    log.error(
-                        "EnergyProfiles validity-state does not match file "
-                        f"({reader.is_valid()} in {self.data_path})."
-                    )
-                    return False
-                file_energy = reader.energy()
-                if abs(self.energy_Ws / file_energy - 1) >= 1e-9:
-                    # ⤷ needed error-margin because result may vary ~ 1e-16
-                    log.error(
-                        "EnergyProfiles max energy does not match file "
-                        f"({self.energy_Ws} vs {file_energy} in {self.data_path})."
-                    )
-                    return False
-        except TypeError:
-            log.error(f"EnergyProfile - hdf5-file could not be read ({self.data_path})")
+        return _check_file_content(self.data_path, [self])
+
+    def check_content(self, reader: Reader) -> bool:
+        """Compare metadata with content of the opened file."""
+        if self.duration != reader.runtime_s:
+            log.error(
+                "EnergyProfile duration does not match runtime of file "
+                f"({self.duration} vs {reader.runtime_s} in {self.data_path})."
+            )
+            return False
+        if self.valid != reader.is_valid():
+            log.error(
+                "EnergyProfiles validity-state does not match file "
+                f"({reader.is_valid()} in {self.data_path})."
+            )
+            return False
+        file_energy = reader.energy()
+        if abs(self.energy_Ws / file_energy - 1) >= 1e-9:
+            # ⤷ needed error-margin because result may vary ~ 1e-16
+            log.error(
+                "EnergyProfiles max energy does not match file "
+                f"({self.energy_Ws} vs {file_energy} in {self.data_path})."
+            )
             return False
         return True
 
@@ -172,6 +224,16 @@ class EnergyProfile(ShpModel):
             )
 
 
+def _check_file_content(path: Path, profiles: list[EnergyProfile]) -> bool:
+    """Open the (existing) file once and compare it to all profiles pointing to it."""
+    try:
+        with Reader(path, verbose=False) as reader:
+            return all(profile.check_content(reader) for profile in profiles)
+    except TypeError:
+        log.error(f"EnergyProfile - hdf5-file could not be read ({path})")
+        return False
+
+
 @final
 class EnergyEnvironment(ContentModel):
     """Metadata representation of spatio-temporal energy-recording."""
@@ -181,7 +243,7 @@ class EnergyEnvironment(ContentModel):
     energy_profiles: Annotated[list[EnergyProfile], Field(min_length=1)]
     """ ⤷  list of individual profiles that make up the environment"""
 
-    metadata: Mapping[str, str | int | float] = {}
+    metadata: dict[str, str | int | float] = Field(default_factory=dict)
     """ ⤷ additional descriptive information
 
     Example for solar: (main) light source, weather conditions, indoor
@@ -214,18 +276,22 @@ class EnergyEnvironment(ContentModel):
             return self.PROFILES_MAX
         return len(self.energy_profiles)
 
-    @property
+    @cached_property
     def duration(self) -> PositiveFloat:
         """Duration of the recorded environment (minimum of all profiles) in seconds."""
         return min(profile.duration for profile in self.energy_profiles)
 
-    @property
+    @cached_property
     def repetitions_ok(self) -> bool:
         """Emit no warning if single profile-path is used more than once."""
         return all(profile.repetitions_ok for profile in self.energy_profiles)
 
     @property
     def valid(self) -> bool:
+        """All profiles are marked valid.
+
+        Not cached on purpose - validity-checks must never see a stale value.
+        """
         return all(profile.valid for profile in self.energy_profiles)
 
     def enforce_validity(self) -> None:
@@ -238,7 +304,18 @@ class EnergyEnvironment(ContentModel):
         if not self.valid:
             raise ValueError(msg + "\n")
 
-    @validate_call(validate_return=False)
+    def _copy_with(self, update: dict[str, Any]) -> Self:
+        """Construct a sibling with updated fields, without validation or copying.
+
+        Profiles are frozen and can be shared, lists & dicts are the only mutable fields.
+        Callers provide fresh lists, metadata gets copied here unless provided.
+        Only fields get transferred -> cached properties start empty.
+        """
+        fields = {name: getattr(self, name) for name in type(self).model_fields}
+        fields["metadata"] = dict(self.metadata)
+        fields.update(update)
+        return type(self).model_construct(_fields_set=self.model_fields_set.union(update), **fields)
+
     def __add__(self, rvalue: ShpModel | list[ShpModel]) -> Self:
         """Extend this EnergyEnvironment.
 
@@ -246,50 +323,53 @@ class EnergyEnvironment(ContentModel):
         - a single EProfile,
         - a list of EnergyProfiles,
         - a second EnergyEnvironment
+
+        Profiles are frozen and get shared, only lists & dicts of the result are new.
         """
         id_new = id_default()
+        now = local_now()
         data: dict[str, Any] = {
             "id": id_new,
-            "created": local_now(),
-            "updated_last": local_now(),
+            "created": now,
+            "updated_last": now,
         }
         if isinstance(rvalue, EnergyProfile):
-            data["modifications"] = deepcopy(
-                [
-                    *self.modifications,
+            data["modifications"] = [
+                *self.modifications,
+                (
                     f"EEnv '{self.name}' - added EnergyProfile {rvalue.data_path.stem}, "
-                    f"ID [{self.id}->{id_new}]",
-                ]
-            )
-            data["energy_profiles"] = deepcopy([*self.energy_profiles, rvalue])
-            return self.model_copy(deep=True, update=data)
+                    f"ID [{self.id}->{id_new}]"
+                ),
+            ]
+            data["energy_profiles"] = [*self.energy_profiles, rvalue]
+            return self._copy_with(data)
         if isinstance(rvalue, list):
             if len(rvalue) == 0:
-                return self.model_copy(deep=True)
-            if isinstance(rvalue[0], EnergyProfile):
-                data["modifications"] = deepcopy(
-                    [
-                        *self.modifications,
+                return self._copy_with({})
+            if all(isinstance(item, EnergyProfile) for item in rvalue):
+                data["modifications"] = [
+                    *self.modifications,
+                    (
                         f"EEnv '{self.name}' - added list of {len(rvalue)} EnergyProfiles, "
-                        f"ID[{self.id}->{id_new}]",
-                    ]
-                )
-                data["energy_profiles"] = deepcopy(self.energy_profiles + rvalue)
-                return self.model_copy(deep=True, update=data)
+                        f"ID[{self.id}->{id_new}]"
+                    ),
+                ]
+                data["energy_profiles"] = self.energy_profiles + rvalue
+                return self._copy_with(data)
             raise ValueError("Addition could not be performed, as types did not match.")
         if isinstance(rvalue, EnergyEnvironment):
-            data["modifications"] = deepcopy(
-                [
-                    *self.modifications,
-                    *rvalue.modifications,
+            data["modifications"] = [
+                *self.modifications,
+                *rvalue.modifications,
+                (
                     f"EEnv '{self.name}' - added EEnv {rvalue.name} with {len(rvalue)} entries, "
-                    f"ID[{self.id}->{id_new}]",
-                ]
-            )
-            data["metadata"] = deepcopy({**rvalue.metadata, **self.metadata})
+                    f"ID[{self.id}->{id_new}]"
+                ),
+            ]
+            data["metadata"] = {**rvalue.metadata, **self.metadata}
             # ⤷ values of right side are kept in case of key-collision
-            data["energy_profiles"] = deepcopy(self.energy_profiles + rvalue.energy_profiles)
-            return self.model_copy(deep=True, update=data)
+            data["energy_profiles"] = self.energy_profiles + rvalue.energy_profiles
+            return self._copy_with(data)
         raise TypeError(
             "Right value of addition must be of type: "
             "EnergyProfile, list[EnergyProfile], EnergyEnvironment."
@@ -300,78 +380,148 @@ class EnergyEnvironment(ContentModel):
     @overload
     def __getitem__(self, value: slice) -> Self: ...
     def __getitem__(self, value):
-        """Select elements from this EEnv similar to list-Ops (slicing, int)."""
-        if isinstance(value, int):
-            if self.repetitions_ok:
-                value %= len(self.energy_profiles)
-            return deepcopy(self.energy_profiles[value])
-        if isinstance(value, slice):
-            if self.repetitions_ok:
-                # bring values into range (out of bounds like -1, 300, ..)
-                log.warning("EEnv-Slice-Access with .repetition_ok==True is beta (funky behavior)")
-                val_start = value.start % self.PROFILES_MAX if value.start else value.start
-                val_stop: int = self.PROFILES_MAX
-                if value.stop:
-                    if value.stop < 0:
-                        val_stop = value.stop % self.PROFILES_MAX
-                    else:
-                        val_stop = min(value.stop, self.PROFILES_MAX)
-
-                if val_start and val_start > val_stop:
-                    val_start = val_stop
-            else:
-                val_start = value.start
-                val_stop = value.stop
+        """Select elements from this EEnv similar to list-Ops (slicing, int).
 
-            if self.repetitions_ok and val_stop > len(self.energy_profiles):
-                # scale profile-list up
-                scale = (val_stop // len(self.energy_profiles)) + 1
-                profiles = scale * self.energy_profiles
-            else:
-                profiles = self.energy_profiles
-            id_new = id_default()
-            slice_new = slice(val_start, val_stop, value.step)
-            data: dict[str, Any] = {
-                "id": id_new,
-                "created": local_now(),
-                "updated_last": local_now(),
-                "modifications": deepcopy(
-                    [
-                        *self.modifications,
-                        f"EEnv '{self.name}' was sliced with {slice_new}, ID[{self.id}->{id_new}]",
-                    ]
-                ),
-                "energy_profiles": deepcopy(profiles[slice_new]),
-            }
-            return self.model_copy(deep=True, update=data)
+        Hot loops can call .get_profile() or .get_slice() directly to skip the dispatch.
+        """
+        if type(value) is int:  # exact type-checks are cheaper than isinstance()
+            return self.get_profile(value)
+        if type(value) is slice:
+            return self.get_slice(value)
+        if isinstance(value, int):  # subclasses like bool
+            return self.get_profile(value)
         raise IndexError("Use int or slice when selecting from EEnv")
 
-    def export(self, output_path: Path) -> None:
-        """Copy local data to new directory and add meta-data-file."""
+    def get_profile(self, index: int) -> EnergyProfile:
+        """Select a single EnergyProfile, equivalent to EEnv[index].
+
+        Profiles are frozen, so the instance gets shared instead of copied.
+        """
+        if self.repetitions_ok:
+            index %= len(self.energy_profiles)
+        return self.energy_profiles[index]
+
+    def get_slice(self, value: slice) -> Self:
+        """Select a sub-environment, equivalent to EEnv[start:stop:step]."""
+        if self.repetitions_ok:
+            # bring values into range (out of bounds like -1, 300, ..)
+            log.warning("EEnv-Slice-Access with .repetition_ok==True is beta (funky behavior)")
+            val_start = value.start % self.PROFILES_MAX if value.start else value.start
+            val_stop: int = self.PROFILES_MAX
+            if value.stop:
+                if value.stop < 0:
+                    val_stop = value.stop % self.PROFILES_MAX
+                else:
+                    val_stop = min(value.stop, self.PROFILES_MAX)
+
+            if val_start and val_start > val_stop:
+                val_start = val_stop
+        else:
+            val_start = value.start
+            val_stop = value.stop
+
+        slice_new = slice(val_start, val_stop, value.step)
+        if not self.repetitions_ok or val_stop <= len(self.energy_profiles):
+            profiles = self.energy_profiles[slice_new]
+            # ⤷ slicing creates a new list, frozen profiles can be shared
+        elif value.step is None or value.step > 0:
+            # repeat profile-list lazily, only selected items get materialized
+            profiles = list(
+                islice(cycle(self.energy_profiles), val_start or 0, val_stop, value.step)
+            )
+        else:
+            # negative steps start at the end of the virtually scaled-up profile-list
+            n_profiles = len(self.energy_profiles)
+            n_scaled = ((val_stop // n_profiles) + 1) * n_profiles
+            profiles = [
+                self.energy_profiles[index % n_profiles]
+                for index in range(*slice_new.indices(n_scaled))
+            ]
+        id_new = id_default()
+        now = local_now()
+        data: dict[str, Any] = {
+            "id": id_new,
+            "created": now,
+            "updated_last": now,
+            "modifications": [
+                *self.modifications,
+                f"EEnv '{self.name}' was sliced with {slice_new}, ID[{self.id}->{id_new}]",
+            ],
+            "energy_profiles": profiles,
+        }
+        return self._copy_with(data)
+
+    def export(self, output_path: Path, *, use_json: bool = False) -> None:
+        """Copy local data to new directory and add meta-data-file.
+
+        Meta-data is stored as eenv.yaml by default. JSON (eenv.json) is faster to
+        emit & parse for consumers that do not need yaml.
+        """
         if output_path.exists():
             # TODO: elegant but unpractical, must be: empty dir or non-existing dir
             msg = f"Warning: path {output_path} already exists"
             raise FileExistsError(msg)
         output_path.mkdir(parents=True)
 
-        # Copy data files & update meta-data
+        # Copy data files
+        # Numbered to avoid collisions. Preserve extensions
+        paths_new = [
+            output_path / f"node{i_:03d}{profile.data_path.suffix}"
+            for i_, profile in enumerate(self.energy_profiles)
+        ]
+        paths_old = [profile.data_path for profile in self.energy_profiles]
+        if paths_new:  # slices can be empty, as they skip validation
+            # copying is IO-bound -> threads overlap the (GIL-free) syscalls
+            with ThreadPoolExecutor(max_workers=min(8, len(paths_new))) as pool:
+                list(pool.map(_copy_file, paths_old, paths_new))
+                # ⤷ raises FileNotFoundError for profiles that are not locally available
+
         content = self.model_dump(mode="json", exclude_unset=True, exclude_defaults=True)
-        for i_, profile in enumerate(self.energy_profiles):
-            # Numbered to avoid collisions. Preserve extensions
-            file_name = f"node{i_:03d}{profile.data_path.suffix}"
-            profile_new = profile.export(output_path / file_name)
-            content["energy_profiles"][i_] = profile_new.model_dump(
-                mode="json", exclude_unset=True, exclude_defaults=True
-            )
+        # ⤷ single dump-call for all profiles, only their paths have to be patched
+        for profile_dict, path_new in zip(content["energy_profiles"], paths_new, strict=True):
+            profile_dict["data_path"] = str(path_new)
+        if use_json:
+            (output_path / "eenv.json").write_bytes(to_json(content, indent=2))
+            # ⤷ serializer of pydantic-core (rust) -> no extra dependency needed
+            return
 
         # Create metadata file
         with (output_path / "eenv.yaml").open("w", encoding="utf-8") as file:
             ryaml.dump(file, content)
 
+    def _scan_directories(self) -> dict[Path, dict[str, os.DirEntry]]:
+        """List the parent-directories of all profiles, one scandir() per directory.
+
+        Directory-entries come with cached file-types -> saves a stat() per profile,
+        which adds up on networked filesystems.
+        """
+        parents = {profile.data_path.parent for profile in self.energy_profiles}
+        return {parent: _list_directory(parent) for parent in parents}
+
     def exists(self) -> bool:
         """Check if embedded files exists."""
-        return all(profile.exists() for profile in self.energy_profiles)
+        entries = self._scan_directories()
+        return all(
+            _path_state(entries[profile.data_path.parent], profile.data_path)[0]
+            for profile in self.energy_profiles
+        )
 
     def check(self) -> bool:
         """Check validity of embedded Energy-Profile."""
-        return all(profile.check() for profile in self.energy_profiles)
+        profiles_by_path: dict[Path, list[EnergyProfile]] = {}
+        for profile in dict.fromkeys(self.energy_profiles):
+            # ⤷ frozen profiles are hashable -> duplicates get checked only once
+            profiles_by_path.setdefault(profile.data_path, []).append(profile)
+        entries = self._scan_directories()
+        for path, profiles in profiles_by_path.items():
+            exists, is_file = _path_state(entries[path.parent], path)
+            if not exists:
+                log.error(f"EnergyProfile does not exist in '{path}'.")
+                return False
+            if not is_file:
+                log.error(f"EnergyProfile is not a file ({path}).")
+                return False
+            if not _check_file_content(path, profiles):
+                # ⤷ profiles sharing a file also share the opened Reader
+                return False
+        return True
@@ -11,6 +11,7 @@ class Compression(str, Enum):
 
     lzf = "lzf"  # not native hdf5
     gzip1 = gzip = default = 1  # higher compr & load
+    blosc_lz4 = "blosc_lz4"  # needs hdf5plugin, byte-shuffle + multithreaded lz4 -> fastest
     null = None
     # NOTE: lzf & external file-compression (xz or zstd) work better than gzip
     #       -> even with additional compression
@@ -7,6 +7,7 @@ with the resulting behavior of the model.
 from datetime import timedelta
 from pathlib import Path
 
+import numpy as np
 from virtual_storage_config import VirtualStorageConfig
 
 from shepherd_core.logger import log
@@ -44,10 +45,10 @@ def experiment_self_discharge_lead_acid() -> None:
         dt_s=dt_s,
     )
 
-    def step(_t: float, _s: float, _v: float) -> float:
+    def step(_t: np.ndarray) -> float:
         return 0
 
-    sim.run(fn=step, duration_s=duration.total_seconds())
+    sim.run_vec(fn=step, duration_s=duration.total_seconds())
     sim.plot(
         path_here,
         f"Experiment {cfg1.name}, self-discharge, "
@@ -82,10 +83,10 @@ def experiment_self_discharge_lipo() -> None:
         dt_s=dt_s,
     )
 
-    def step(_t: float, _s: float, _v: float) -> float:
+    def step(_t: np.ndarray) -> float:
         return 0
 
-    sim.run(fn=step, duration_s=duration.total_seconds())
+    sim.run_vec(fn=step, duration_s=duration.total_seconds())
     sim.plot(
         path_here,
         f"Experiment {cfg1.name}, self-discharge, "
@@ -113,10 +114,10 @@ def experiment_self_discharge_tantal_avx() -> None:
         dt_s=dt_s,
     )
 
-    def step(_t: float, _s: float, _v: float) -> float:
+    def step(_t: np.ndarray) -> float:
         return 0
 
-    sim.run(fn=step, duration_s=duration.total_seconds())
+    sim.run_vec(fn=step, duration_s=duration.total_seconds())
     sim.plot(path_here, f"Experiment Tantal AVX, self-discharge {duration.total_seconds()} s")
 
 
@@ -142,10 +143,10 @@ def experiment_self_discharge_mlcc_tayo() -> None:
         dt_s=dt_s,
     )
 
-    def step(_t: float, _s: float, _v: float) -> float:
+    def step(_t: np.ndarray) -> float:
         return 0
 
-    sim.run(fn=step, duration_s=duration.total_seconds())
+    sim.run_vec(fn=step, duration_s=duration.total_seconds())
     sim.plot(path_here, f"Experiment MLCC Tayo, self-discharge {duration.total_seconds()} s")
 
 
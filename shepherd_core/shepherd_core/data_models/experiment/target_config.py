@@ -64,7 +64,8 @@ class TargetConfig(ShpModel):
         """Validate that a mapping between targets and EEnvs can be found."""
         if self.energy_env.repetitions_ok:
             return self
-        n_env = len(self.energy_env)
+        n_env = len(self.energy_env.energy_profiles)
+        # ⤷ skips re-evaluating .repetitions_ok in EnergyEnvironment.__len__()
         n_tgt = len(self.target_IDs)
         if n_env == n_tgt:
             return self
@@ -91,6 +92,8 @@ class TargetConfig(ShpModel):
             # note: added xpt in text because pydantic refuses to show "from xpt" part below
             raise ValueError(msg) from xpt
         # check IDs
+        fw_defaults: dict[str, Firmware] = {}
+        # ⤷ targets often share MCUs -> only query each default firmware once
         for id_ in self.target_IDs:
             target = Target(id=id_)
             for mcu_num in [1, 2]:
@@ -99,8 +102,11 @@ class TargetConfig(ShpModel):
                 tgt_mcu = target[f"mcu{mcu_num}"]
                 has_mcu = tgt_mcu is not None
                 if not has_fw and has_mcu:
-                    fw_def = Firmware(name=tgt_mcu.fw_name_default)
-                    # ⤷ this will raise if default is faulty
+                    fw_name = tgt_mcu.fw_name_default
+                    if fw_name not in fw_defaults:
+                        fw_defaults[fw_name] = Firmware(name=fw_name)
+                        # ⤷ this will raise if default is faulty
+                    fw_def = fw_defaults[fw_name]
                     if tgt_mcu.name != fw_def.mcu.name:
                         msg = (
                             f"Default-Firmware for MCU{mcu_num} of Target-ID '{target.id}' "
@@ -30,6 +30,12 @@ from .data_models.base.calibration import CalibrationSeries
 from .data_models.base.timezone import local_tz
 from .data_models.content.enum_datatypes import EnergyDType
 
+try:
+    import hdf5plugin
+    # ⤷ optional, registers additional filters (i.e. blosc) for reading compressed files
+except ImportError:
+    hdf5plugin = None
+
 if TYPE_CHECKING:
     from collections.abc import Generator
     from collections.abc import Mapping
@@ -37,6 +43,43 @@ if TYPE_CHECKING:
     from types import TracebackType
 
 
+class TimeSeries:
+    """Dataset-like stand-in for the time-dataset of timeless files.
+
+    Timestamps (raw, like the dataset) get generated on access: start + index * interval.
+    Length follows the reference-dataset (voltage).
+    """
+
+    dtype = np.dtype("u8")
+
+    def __init__(self, ds_ref: h5py.Dataset, start: int, interval: int) -> None:
+        self._ds_ref = ds_ref
+        self.start: int = start
+        self.interval: int = interval
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._ds_ref.shape
+
+    @property
+    def size(self) -> int:
+        return self._ds_ref.shape[0]
+
+    def __len__(self) -> int:
+        return self._ds_ref.shape[0]
+
+    def __getitem__(self, key: int | slice) -> np.ndarray | np.uint64:
+        if isinstance(key, slice):
+            indices = np.arange(*key.indices(len(self)), dtype=self.dtype)
+            return np.uint64(self.start) + np.uint64(self.interval) * indices
+        index = int(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range for timeless time-series")
+        return np.uint64(self.start + self.interval * index)
+
+
 class Reader:
     """Sequentially Reads shepherd-data from HDF5 file.
 
@@ -44,6 +87,8 @@ class Reader:
     ----
         file_path: Path of hdf5 file containing shepherd data with iv-samples, iv-curves or isc&voc
         verbose: more debug-info during usage, 'None' skips the setter
+        chunk_cache_bytes: size of hdf5s raw chunk-cache (per dataset), 'None' keeps the
+            default of 1 MiB. Bulk-copies or random access profit from 64 - 256 MiB
 
     """
 
@@ -66,6 +111,7 @@ class Reader:
         file_path: Path,
         *,
         verbose: bool = True,
+        chunk_cache_bytes: int | None = None,
     ) -> None:
         self.file_path: Path = file_path.resolve()
 
@@ -100,7 +146,9 @@ class Reader:
                 )
 
             try:
-                self.h5file = h5py.File(self.file_path, "r")  # = readonly
+                self.h5file = h5py.File(
+                    self.file_path, "r", **self._chunk_cache_kwargs(chunk_cache_bytes)
+                )  # = readonly
                 self._reader_opened = True
             except OSError as xcp:
                 msg = f"Unable to open HDF5-File '{self.file_path.name}'"
@@ -119,9 +167,18 @@ class Reader:
             msg = (f"Type of opened file is not h5py.File, for {self.file_path.name}",)
             raise TypeError(msg)
 
-        self.ds_time: h5py.Dataset = self.h5file["data"]["time"]
         self.ds_voltage: h5py.Dataset = self.h5file["data"]["voltage"]
         self.ds_current: h5py.Dataset = self.h5file["data"]["current"]
+        self.ds_time: h5py.Dataset | TimeSeries
+        if "time_interval" in self.h5file["data"].attrs:
+            # timeless file -> timestamps only get generated when accessed
+            self.ds_time = TimeSeries(
+                ds_ref=self.ds_voltage,
+                start=int(self.h5file["data"].attrs["time_start"]),
+                interval=int(self.h5file["data"].attrs["time_interval"]),
+            )
+        else:
+            self.ds_time = self.h5file["data"]["time"]
 
         # retrieve cal-data
         if not hasattr(self, "_cal"):
@@ -152,6 +209,17 @@ class Reader:
                 self.data_rate / 2**10,
             )
 
+    @staticmethod
+    def _chunk_cache_kwargs(chunk_cache_bytes: int | None) -> dict[str, Any]:
+        """Translate cache-size into arguments for h5py.File()."""
+        if chunk_cache_bytes is None:
+            return {}
+        return {
+            "rdcc_nbytes": chunk_cache_bytes,
+            "rdcc_nslots": 100_003,  # prime, > 10x the number of 40 kB-chunks in 256 MiB
+            "rdcc_w0": 0.75,
+        }
+
     def __enter__(self) -> Self:
         return self
 
@@ -260,6 +328,11 @@ class Reader:
             omit_timestamps=omit_ts,
         )
 
+    @property
+    def is_timeless(self) -> bool:
+        """File stores only start & interval of timestamps instead of a time-dataset."""
+        return isinstance(self.ds_time, TimeSeries)
+
     def get_time_start(self) -> datetime | None:
         """Timestamp of first IV-Sample."""
         if self.samples_n < 1:
@@ -416,7 +489,9 @@ class Reader:
                 self.file_path.name,
             )
         # same length of datasets:
-        samples_n = self.h5file["data"]["time"].shape[0]
+        timeless = "time_interval" in self.h5file["data"].attrs
+        # ⤷ time-dataset stays empty, timestamps get generated from start & interval
+        samples_n = self.h5file["data"]["voltage" if timeless else "time"].shape[0]
         for dset in ["voltage", "current"]:
             ds_size = self.h5file["data"][dset].shape[0]
             if ds_size != samples_n:
@@ -503,7 +578,8 @@ class Reader:
             idx_stop = min(idx_start + self.max_elements, self.samples_n)
             vol_v = self._cal.voltage.raw_to_si(self.ds_voltage[idx_start:idx_stop])
             cur_a = self._cal.current.raw_to_si(self.ds_current[idx_start:idx_stop])
-            return (vol_v[:] * cur_a[:]).sum() * self.sample_interval_s
+            return np.dot(vol_v, cur_a) * self.sample_interval_s
+            # ⤷ fused multiply & sum, no temporary product-array
 
         energy_ws = [_calc_energy(i) for i in job_iter]
         return float(sum(energy_ws))
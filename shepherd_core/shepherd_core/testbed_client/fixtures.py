@@ -1,6 +1,7 @@
 """Current implementation of a file-based database."""
 
 import copy
+import os
 import pickle
 from collections.abc import Iterable
 from collections.abc import Mapping
@@ -18,6 +19,7 @@ from shepherd_core.data_models.base.timezone import local_now
 from shepherd_core.data_models.base.timezone import local_tz
 from shepherd_core.data_models.base.wrapper import Wrapper
 from shepherd_core.logger import log
+from shepherd_core.version import core_version
 
 from .cache_path import cache_user_path
 
@@ -36,8 +38,19 @@ class Fixture:
         self.model_type: str = model_type.lower()
         self.elements_by_name: dict[str, dict[str, Any]] = {}
         self.elements_by_id: dict[int, dict[str, Any]] = {}
+        self._resolved: dict[str, tuple[dict[str, Any], list[str]]] = {}
+        # ⤷ memoized inheritance of stored fixtures, invalidated on insert
         self.update_iterator(reset=True)
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_resolved", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._resolved = {}
+
     def insert_verified(self, data: Wrapper) -> None:
         # ⤷ TODO: could get easier
         #    - when not model_name but class used
@@ -52,6 +65,7 @@ class Fixture:
         if "id" in data.parameters:  # ID is optional
             id_ = data.parameters["id"]
             self.elements_by_id[id_] = data_model
+        self._resolved.clear()
         self.update_iterator()
 
     def insert_raw(self, data_model: dict) -> None:
@@ -59,6 +73,7 @@ class Fixture:
         self.elements_by_name[str(data_model["name"]).lower()] = data_model
         if "id" in data_model:  # ID is optional
             self.elements_by_id[data_model["id"]] = data_model
+        self._resolved.clear()
 
     def update_iterator(self, *, reset: bool = False) -> None:
         if reset:
@@ -110,18 +125,14 @@ class Fixture:
             # ⤷ will also remove entry from dict
             if "name" in values and len(chain) < 1:
                 base_name = str(values.get("name"))
-                if base_name in chain:
-                    msg = f"Inheritance-Circle detected ({base_name} already in {chain})"
-                    raise ValueError(msg)
                 if base_name == fixture_name:
                     msg = f"Inheritance-Circle detected ({base_name} == {fixture_name})"
                     raise ValueError(msg)
                 chain.append(base_name)
-            fixture_base = copy.copy(self[fixture_name])
-            log.debug("'%s' will inherit from '%s'", self.model_type, fixture_name)
-            fixture_base["name"] = fixture_name
-            chain.append(fixture_name)
-            base_dict, chain = self.inheritance(values=fixture_base, chain=chain)
+            base_resolved, base_chain = self._resolve(fixture_name, set())
+            # ⤷ circles are only searched among stored fixtures -> result independent of memo
+            chain.extend(base_chain)
+            base_dict = copy.copy(base_resolved)
             for key, value in values.items():
                 # keep previous entries
                 base_dict[key] = value
@@ -152,6 +163,26 @@ class Fixture:
 
         return values, chain
 
+    def _resolve(self, fixture_name: str, visited: set[str]) -> tuple[dict[str, Any], list[str]]:
+        """Walk inheritance-chain of a stored fixture (memoized, result must not be altered)."""
+        if fixture_name in self._resolved:
+            return self._resolved[fixture_name]
+        # ⤷ keyed by spelling, as that ends up in name & chain
+        if str(fixture_name).lower() in visited:
+            msg = f"Inheritance-Circle detected ({fixture_name} already in {visited})"
+            raise ValueError(msg)
+        visited.add(str(fixture_name).lower())
+        fixture_base = copy.copy(self[fixture_name])
+        log.debug("'%s' will inherit from '%s'", self.model_type, fixture_name)
+        fixture_base["name"] = fixture_name
+        chain = [fixture_name]
+        if "inherit_from" in fixture_base:
+            parent_dict, parent_chain = self._resolve(fixture_base.pop("inherit_from"), visited)
+            chain.extend(parent_chain)
+            fixture_base = self.fill_model(fixture_base, parent_dict)
+        self._resolved[fixture_name] = (fixture_base, chain)
+        return fixture_base, chain
+
     @staticmethod
     def fill_model(model: Mapping, base: dict) -> dict:
         base = copy.copy(base)
@@ -180,6 +211,14 @@ def file_older_than(file: Path, delta: timedelta) -> bool:
     return mtime < cutoff
 
 
+def pickle_cache_enabled() -> bool:
+    """Only sheep-hosts (observers) use the pickled fixtures, as they have to start quickly.
+
+    Elsewhere the yaml-files get parsed, to avoid loading pickles from a shared user-cache.
+    """
+    return Path("/lib/firmware/am335x-pru0-fw").exists()
+
+
 class Fixtures:
     """A collection of individual fixture-elements."""
 
@@ -192,36 +231,29 @@ class Fixtures:
         self.reset = reset
         self.resources: dict[str, Fixture] = {}
 
-        cache_file = cache_user_path / "fixtures.pickle"
-        sheep_detect = Path("/lib/firmware/am335x-pru0-fw").exists()
-
-        if (
-            sheep_detect
-            and cache_file.exists()
-            and not file_older_than(cache_file, timedelta(hours=24))
-            and not self.reset
-        ):
-            # speedup by loading from cache
-            # TODO: also add version as criterion
-            with cache_file.open("rb", buffering=-1) as fd:
-                self.resources = pickle.load(fd)  # noqa: S301
-            log.debug(" -> found & used pickled fixtures")
+        if not isinstance(file_path, Path):
+            file_path: Path = Path(__file__).parent.parent.resolve() / "data_models"
         else:
-            if not isinstance(file_path, Path):
-                file_path: Path = Path(__file__).parent.parent.resolve() / "data_models"
-            else:
-                validate = True  # expect untested data
-
-            if file_path.is_file():
-                files = [file_path]
-            elif file_path.is_dir():
-                files = list(
-                    file_path.glob("**/*" + self.suffix)
-                )  # for py>=3.12: case_sensitive=False
-                log.debug(" -> got %s %s-files", len(files), self.suffix)
-            else:
-                raise ValueError("Path must either be file or directory (or empty)")
+            validate = True  # expect untested data
+
+        if file_path.is_file():
+            files = [file_path]
+        elif file_path.is_dir():
+            files = sorted(file_path.glob("**/*" + self.suffix))
+            # ⤷ for py>=3.12: case_sensitive=False
+            log.debug(" -> got %s %s-files", len(files), self.suffix)
+        else:
+            raise ValueError("Path must either be file or directory (or empty)")
+
+        # speedup by loading from cache, only for tested data
+        use_cache = not validate and pickle_cache_enabled()
+        cache_file = cache_user_path / "fixtures.pickle"
+        cache_key = (core_version, [(file.as_posix(), file.stat().st_mtime_ns) for file in files])
+        # ⤷ any change to version or fixture-files invalidates the cache
+        if use_cache and not self.reset:
+            self.resources = self._load_cache(cache_file, cache_key)
 
+        if len(self.resources) < 1:
             for file in files:
                 if validate:
                     self.validate_file(file)
@@ -230,13 +262,39 @@ class Fixtures:
 
             if len(self.resources) < 1:
                 log.error(f"No fixture-components found at {file_path.as_posix()}")
-            elif sheep_detect:
-                cache_file.parent.mkdir(parents=True, exist_ok=True)
-                with cache_file.open("wb", buffering=-1) as fd:
-                    pickle.dump(self.resources, fd)
+            elif use_cache:
+                self._store_cache(cache_file, cache_key)
         for ckey in self.resources:
             self.resources[ckey].update_iterator(reset=True)
 
+    @staticmethod
+    def _load_cache(cache_file: Path, cache_key: tuple) -> dict[str, Fixture]:
+        if not cache_file.exists() or file_older_than(cache_file, timedelta(hours=24)):
+            return {}
+        try:
+            with cache_file.open("rb", buffering=-1) as fd:
+                key, resources = pickle.load(fd)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            log.debug(" -> pickled fixtures are unreadable")
+            return {}
+        if key != cache_key:
+            log.debug(" -> pickled fixtures are outdated")
+            return {}
+        log.debug(" -> found & used pickled fixtures")
+        return resources
+
+    def _store_cache(self, cache_file: Path, cache_key: tuple) -> None:
+        cache_tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+        # ⤷ write & rename -> concurrent processes never read a partial file
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with cache_tmp.open("wb", buffering=-1) as fd:
+                pickle.dump((cache_key, self.resources), fd, protocol=pickle.HIGHEST_PROTOCOL)
+            cache_tmp.replace(cache_file)
+        except OSError:
+            log.debug(" -> pickling fixtures failed (read-only cache?)")
+            cache_tmp.unlink(missing_ok=True)
+
     def _insert_file(self, file: Path) -> None:
         with file.open(encoding="utf-8") as fd:
             fixtures = ryaml.load(fd)
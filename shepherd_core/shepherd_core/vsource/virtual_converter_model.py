@@ -14,8 +14,6 @@ Compromises:
 
 """
 
-import math
-
 from shepherd_core.data_models.base.calibration import CalibrationEmulator
 from shepherd_core.data_models.content.virtual_source_config import LUT_SIZE
 from shepherd_core.data_models.content.virtual_source_config_pru import ConverterPRUConfig
@@ -116,6 +114,18 @@ class VirtualConverterModel:
         self.is_outputting: bool = False
         self.vsource_skip_gpio_logging: bool = False
 
+        # LUTs pre-scaled & divisors resolved once -> per sample only indexing remains
+        # (nested python lists are faster to index from python than numpy-arrays)
+        self._lut_inp_efficiency: list[list[float]] = [
+            [value / (2**8) for value in row] for row in self._cfg.LUT_inp_efficiency_n8
+        ]
+        self._lut_out_inv_efficiency: list[float] = [
+            value / (2**4) for value in self._cfg.LUT_out_inv_efficiency_n4
+        ]
+        self._lut_inp_V_div: int = 2**self._cfg.LUT_input_V_min_log2_uV
+        self._lut_inp_I_div: int = 2**self._cfg.LUT_input_I_min_log2_nA
+        self._lut_out_I_div: int = 2**self._cfg.LUT_output_I_min_log2_nA
+
     def calc_inp_power(self, input_voltage_uV: float, input_current_nA: float) -> float:
         # Next 2 lines are Python-specific (model unsigned int)
         input_voltage_uV = max(0.0, input_voltage_uV)
@@ -240,22 +250,23 @@ class VirtualConverterModel:
         return self.V_out_dac_raw
 
     def get_input_efficiency(self, voltage_uV: float, current_nA: float) -> float:
-        voltage_n = int(voltage_uV / (2**self._cfg.LUT_input_V_min_log2_uV))
-        current_n = int(current_nA / (2**self._cfg.LUT_input_I_min_log2_nA))
-        pos_v = int(voltage_n) if (voltage_n > 0) else 0  # V-Scale is Linear!
-        pos_c = int(math.log2(current_n)) if (current_n > 0) else 0
+        voltage_n = int(voltage_uV / self._lut_inp_V_div)
+        current_n = int(current_nA / self._lut_inp_I_div)
+        pos_v = max(voltage_n, 0)  # V-Scale is Linear!
+        pos_c = current_n.bit_length() - 1 if (current_n > 0) else 0
+        # ⤷ integer log2, like the msb-search of the pru
         if pos_v >= LUT_SIZE:
             pos_v = LUT_SIZE - 1
         if pos_c >= LUT_SIZE:
             pos_c = LUT_SIZE - 1
-        return self._cfg.LUT_inp_efficiency_n8[pos_v][pos_c] / (2**8)
+        return self._lut_inp_efficiency[pos_v][pos_c]
 
     def get_output_inv_efficiency(self, current_nA: float) -> float:
-        current_n = int(current_nA / (2**self._cfg.LUT_output_I_min_log2_nA))
-        pos_c = int(math.log2(current_n)) if (current_n > 0) else 0
+        current_n = int(current_nA / self._lut_out_I_div)
+        pos_c = current_n.bit_length() - 1 if (current_n > 0) else 0
         if pos_c >= LUT_SIZE:
             pos_c = LUT_SIZE - 1
-        return self._cfg.LUT_out_inv_efficiency_n4[pos_c] / (2**4)
+        return self._lut_out_inv_efficiency[pos_c]
 
     def set_P_input_fW(self, value: float) -> None:
         self.P_inp_fW = value
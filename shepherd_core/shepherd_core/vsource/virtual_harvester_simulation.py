@@ -10,6 +10,7 @@ The output file can be analyzed and plotted with shepherds tool suite.
 from contextlib import ExitStack
 from pathlib import Path
 
+import numpy as np
 from tqdm import tqdm
 
 from shepherd_core.data_models.base.calibration import CalibrationHarvester
@@ -50,22 +51,34 @@ def simulate_harvester(
             voltage_step_V=file_inp.get_voltage_step(),
         )
         hrv = VirtualHarvesterModel(hrv_pru)
+        ivcurve_sample = hrv.ivcurve_sample
         e_out_Ws = 0.0
+        if file_inp.ds_voltage.shape != file_inp.ds_current.shape:
+            msg = f"Input-file {path_input.name} has unequal voltage & current datasets"
+            raise ValueError(msg)
+        # ⤷ checked once -> chunks are guaranteed to match in size
 
         for t_, v_inp, i_inp in tqdm(
             file_inp.read(is_raw=True), total=file_inp.chunks_n, desc="Chunk", leave=False
         ):
-            v_uV = cal_inp.voltage.raw_to_si(v_inp) * 1e6
-            i_nA = cal_inp.current.raw_to_si(i_inp) * 1e9
-            length = min(v_uV.size, i_nA.size)
-            for n_ in range(length):
-                v_uV[n_], i_nA[n_] = hrv.ivcurve_sample(
-                    _voltage_uV=int(v_uV[n_]), _current_nA=int(i_nA[n_])
-                )
-            e_out_Ws += (v_uV * i_nA).sum() * 1e-15 * file_inp.sample_interval_s
+            v_uV = cal_inp.voltage.raw_to_si(v_inp)
+            v_uV *= 1e6  # in-place scaling of fresh array avoids another allocation
+            i_nA = cal_inp.current.raw_to_si(i_inp)
+            i_nA *= 1e9
+            # per-sample model works on python-ints -> convert buffers once, not per element
+            samples = [
+                ivcurve_sample(v_, i_)
+                for v_, i_ in zip(v_uV.astype(int).tolist(), i_nA.astype(int).tolist(), strict=True)
+            ]
+            if samples:
+                v_uV[:], i_nA[:] = np.array(samples, dtype=float).T
+            e_out_Ws += np.dot(v_uV, i_nA) * 1e-15 * file_inp.sample_interval_s
+            # ⤷ fused multiply & sum, no temporary array
             if path_output:
-                v_out = cal_out.voltage.si_to_raw(v_uV / 1e6)
-                i_out = cal_out.current.si_to_raw(i_nA / 1e9)
+                v_uV /= 1e6  # buffers are not needed anymore -> rescale in place
+                i_nA /= 1e9
+                v_out = cal_out.voltage.si_to_raw(v_uV)
+                i_out = cal_out.current.si_to_raw(i_nA)
                 file_out.append_iv_data_raw(t_, v_out, i_out)
 
     return e_out_Ws
@@ -72,19 +72,30 @@ def simulate_source(
         else:
             stats_internal = None
 
+        # bind hot methods once -> avoids attribute lookups per sample
+        iterate_sampling = src.iterate_sampling
+        get_power_good = src.cnv.get_power_good_hysteresis
+        target_step = target.step
+
         for t_, v_inp, i_inp in tqdm(
             file_inp.read(is_raw=True), total=file_inp.chunks_n, desc="Chunk", leave=False
         ):
-            v_uV = 1e6 * cal_inp.voltage.raw_to_si(v_inp)
-            i_nA = 1e9 * cal_inp.current.raw_to_si(i_inp)
+            v_uV = cal_inp.voltage.raw_to_si(v_inp)
+            v_uV *= 1e6
+            i_nA = cal_inp.current.raw_to_si(i_inp)
+            i_nA *= 1e9
+            # per-sample model works on python-ints -> convert buffers once, not per element
+            v_inp_uV = v_uV.astype(int).tolist()
+            i_inp_nA = i_nA.astype(int).tolist()
 
             for n_ in range(len(t_)):
-                v_uV[n_] = src.iterate_sampling(
-                    V_inp_uV=int(v_uV[n_]),
-                    I_inp_nA=int(i_nA[n_]),
+                v_out_uV = iterate_sampling(
+                    V_inp_uV=v_inp_uV[n_],
+                    I_inp_nA=i_inp_nA[n_],
                     I_out_nA=i_out_nA,
                 )
-                i_out_nA = target.step(int(v_uV[n_]), pwr_good=src.cnv.get_power_good_hysteresis())
+                v_uV[n_] = v_out_uV
+                i_out_nA = target_step(int(v_out_uV), pwr_good=get_power_good())
                 i_nA[n_] = i_out_nA
 
                 if stats_internal is not None:
@@ -99,14 +110,16 @@ def simulate_source(
                         i_out_nA * 1e-6,
                         src.cnv.P_inp_fW * 1e-12,  # mW
                         src.cnv.P_out_fW * 1e-12,
-                        src.cnv.get_power_good_hysteresis(),
+                        get_power_good(),
                     ]
                     stats_sample += 1
 
-            e_out_Ws += (v_uV * i_nA).sum() * 1e-15 * file_inp.sample_interval_s
+            e_out_Ws += np.dot(v_uV, i_nA) * 1e-15 * file_inp.sample_interval_s
             if path_output:
-                v_out = cal_out.voltage.si_to_raw(1e-6 * v_uV)
-                i_out = cal_out.current.si_to_raw(1e-9 * i_nA)
+                v_uV *= 1e-6  # buffers are not needed anymore -> rescale in place
+                i_nA *= 1e-9
+                v_out = cal_out.voltage.si_to_raw(v_uV)
+                i_out = cal_out.current.si_to_raw(i_nA)
                 file_out.append_iv_data_raw(t_, v_out, i_out)
 
     if stats_internal is not None:
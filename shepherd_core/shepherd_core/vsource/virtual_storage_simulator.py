@@ -18,7 +18,8 @@ class StorageSimulator:
     - monitors cell-current and voltage, open circuit voltage, state of charge and time
     - takes config with a list of storage-models and timebase
     - runs with a total step-count as config and a current-providing function
-        taking time, cell-voltage and SoC as arguments
+        taking time (or sample-index), cell-voltage and SoC as arguments
+    - state-independent current-traces can be computed for the whole time-base at once (run_vec)
 
     The recorded data can be visualized by generating plots.
     """
@@ -38,19 +39,28 @@ class StorageSimulator:
         self.SoC: np.ndarray | None = None
         self.SoC_eff: np.ndarray | None = None
 
-    @validate_call
-    def run(self, fn: Callable, duration_s: PositiveFloat) -> None:
+    def _allocate(self, duration_s: float) -> None:
         self.t_s = np.arange(0, duration_s, self.dt_s)
         self.I_input = np.zeros((len(self.models), self.t_s.shape[0]))
         self.V_OC = np.zeros((len(self.models), self.t_s.shape[0]))
         self.V_cell = np.zeros((len(self.models), self.t_s.shape[0]))
         self.SoC = np.zeros((len(self.models), self.t_s.shape[0]))
         self.SoC_eff = np.zeros((len(self.models), self.t_s.shape[0]))
+
+    @validate_call
+    def run(self, fn: Callable, duration_s: PositiveFloat, *, pass_index: bool = False) -> None:
+        """Simulate all models step by step with a state-dependent current-function.
+
+        fn gets called with time, SoC and cell-voltage. With pass_index the integer
+        sample-index replaces the time, i.e. for periodic sources that count steps.
+        """
+        self._allocate(duration_s)
+        x_axis = range(self.t_s.shape[0]) if pass_index else self.t_s
         for i, model in enumerate(self.models):
             SoC = 1.0
             V_cell = 0.0
-            for j, t_s in enumerate(self.t_s):
-                I_charge = fn(t_s, SoC, V_cell)
+            for j, x_val in enumerate(x_axis):
+                I_charge = fn(x_val, SoC, V_cell)
                 V_OC, V_cell, SoC, SoC_eff = model.step(I_charge)
                 self.I_input[i, j] = I_charge
                 self.V_OC[i, j] = V_OC
@@ -58,6 +68,22 @@ class StorageSimulator:
                 self.SoC[i, j] = SoC
                 self.SoC_eff[i, j] = SoC_eff
 
+    @validate_call
+    def run_vec(self, fn: Callable, duration_s: PositiveFloat) -> None:
+        """Faster variant of .run() for current-traces that do not depend on the model-state.
+
+        The function gets called only once with the whole time-base (array)
+        and has to return the charging current for every step (array or scalar).
+        """
+        self._allocate(duration_s)
+        I_charge = np.broadcast_to(np.asarray(fn(self.t_s), dtype=float), self.t_s.shape)
+        I_list = I_charge.tolist()
+        for i, model in enumerate(self.models):
+            self.I_input[i] = I_charge
+            results = [model.step(I_) for I_ in I_list]
+            if results:
+                self.V_OC[i], self.V_cell[i], self.SoC[i], self.SoC_eff[i] = np.array(results).T
+
     @validate_call
     def plot(self, path: Path, title: str, *, plot_delta_v: bool = False) -> None:
         try:
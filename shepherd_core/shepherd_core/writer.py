@@ -25,6 +25,11 @@ from .data_models.content.enum_datatypes import EnergyDType
 from .data_models.content.enum_datatypes import compression_dict
 from .reader import Reader
 
+try:
+    import hdf5plugin
+except ImportError:
+    hdf5plugin = None
+
 
 def unique_path(base_path: str | Path, suffix: str) -> Path:
     """Find an unused filename in case it already exists.
@@ -50,6 +55,8 @@ class Writer(Reader):
      - gzip: good compression, moderate speed, select level from 1-9, default is 4
              -> lower levels seem fine
              -> _algo=number instead of "gzip" is read as compression level for gzip
+     - blosc_lz4: compression close to gzip1 at much higher speed (byte-shuffle + lz4)
+             -> needs 'pip install shepherd-core[compression]' for writing & reading
      -> comparison / benchmarks https://www.h5py.org/lzf/
 
     Args:
@@ -63,7 +70,13 @@ class Writer(Reader):
             units later.
         modify_existing: (bool) explicitly enable modifying existing file
             otherwise a unique name will be found
-        compression: (str) use either None, lzf or "1" (gzips compression level)
+        compression: (str) use either None, lzf, "1" (gzips compression level) or blosc_lz4
+        chunk_samples: (int) hdf5-chunk-size of datasets, must be a multiple of
+            CHUNK_SAMPLES_N. Bulk-writers profit from ~1 MiB chunks (i.e. 250_000),
+            the default suits small appends (i.e. live recordings)
+        chunk_cache_bytes: (int) size of hdf5s raw chunk-cache (per dataset), see Reader
+        timeless: (bool) omit the time-dataset & only store start + interval of timestamps.
+            Saves most of the file-size for low-entropy data, assumes continuous sampling
         verbose: (bool) provides more debug-info
 
     """
@@ -72,8 +85,6 @@ class Writer(Reader):
     MODE_DEFAULT: str = "harvester"
     DATATYPE_DEFAULT: EnergyDType = EnergyDType.ivsample
 
-    _CHUNK_SHAPE: tuple = (Reader.CHUNK_SAMPLES_N,)
-
     @validate_call
     def __init__(
         self,
@@ -86,13 +97,19 @@ class Writer(Reader):
         *,
         modify_existing: bool = False,
         force_overwrite: bool = False,
+        chunk_samples: int = Reader.CHUNK_SAMPLES_N,
+        chunk_cache_bytes: int | None = None,
+        timeless: bool = False,
         verbose: bool = True,
     ) -> None:
+        if chunk_samples < 1 or chunk_samples % self.CHUNK_SAMPLES_N != 0:
+            msg = f"chunk_samples must be a multiple of {self.CHUNK_SAMPLES_N}"
+            raise ValueError(msg)
+        self._chunk_shape: tuple[int] = (chunk_samples,)
+        self._timeless = timeless
+        self._gaps_warned = False
         self._modify = modify_existing
-        if compression is not None:
-            self._compression = compression_dict[compression.value]
-        else:
-            self._compression = None
+        self._compression: dict[str, Any] = self._compression_kwargs(compression)
 
         if not hasattr(self, "_logger"):
             self._logger: logging.Logger = logging.getLogger("SHPCore.Writer")
@@ -122,12 +139,17 @@ class Writer(Reader):
             file_path = file_path_new
 
         # open file
+        cache_kwargs = self._chunk_cache_kwargs(chunk_cache_bytes)
         if self._modify:
-            self.h5file = h5py.File(file_path, "r+")  # = rw
+            self.h5file = h5py.File(file_path, "r+", **cache_kwargs)  # = rw
+            if timeless and "time_interval" not in self.h5file["data"].attrs:
+                self.h5file.close()
+                msg = f"Existing file has a time-dataset, can't be extended timeless ({file_path})"
+                raise ValueError(msg)
         else:
             if not file_path.parent.exists():
                 file_path.parent.mkdir(parents=True)
-            self.h5file = h5py.File(file_path, "w")
+            self.h5file = h5py.File(file_path, "w", **cache_kwargs)
             # ⤷ write, truncate if exist
             self._create_skeleton()
 
@@ -195,6 +217,22 @@ class Writer(Reader):
 
         super().__init__(file_path=file_path, verbose=verbose)
 
+    @staticmethod
+    def _compression_kwargs(compression: Compression | None) -> dict[str, Any]:
+        """Translate compression-choice into filter-arguments for create_dataset()."""
+        if compression is None:
+            return {"compression": None}
+        if compression == Compression.blosc_lz4:
+            if hdf5plugin is None:
+                raise ImportError(
+                    "Please install functionality with "
+                    "'pip install shepherd-core[compression] -U' first"
+                )
+            return dict(hdf5plugin.Blosc(cname="lz4", clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+        algo = compression_dict[compression.value]
+        return {"compression": algo, "shuffle": algo is not None}
+        # ⤷ byte-shuffle groups the (mostly constant) high bytes of samples -> better ratio
+
     def __enter__(self) -> Self:
         super().__enter__()
         return self
@@ -240,19 +278,24 @@ class Writer(Reader):
             (0,),
             dtype="u8",
             maxshape=(None,),
-            chunks=self._CHUNK_SHAPE,
-            compression=self._compression,
+            chunks=self._chunk_shape,
+            **self._compression,
         )
         grp_data["time"].attrs["unit"] = "s"
         grp_data["time"].attrs["description"] = "system time [s] = value * gain + (offset)"
+        if self._timeless:
+            # time-dataset stays empty (holds calibration), Reader generates timestamps
+            samplerate_sps = getattr(self, "samplerate_sps", core_config.SAMPLERATE_SPS)
+            grp_data.attrs["time_start"] = 0
+            grp_data.attrs["time_interval"] = round(10**9 // samplerate_sps)
 
         grp_data.create_dataset(
             "current",
             (0,),
             dtype="u4",
             maxshape=(None,),
-            chunks=self._CHUNK_SHAPE,
-            compression=self._compression,
+            chunks=self._chunk_shape,
+            **self._compression,
         )
         grp_data["current"].attrs["unit"] = "A"
         grp_data["current"].attrs["description"] = "current [A] = value * gain + offset"
@@ -262,8 +305,8 @@ class Writer(Reader):
             (0,),
             dtype="u4",
             maxshape=(None,),
-            chunks=self._CHUNK_SHAPE,
-            compression=self._compression,
+            chunks=self._chunk_shape,
+            **self._compression,
         )
         grp_data["voltage"].attrs["unit"] = "V"
         grp_data["voltage"].attrs["description"] = "voltage [V] = value * gain + offset"
@@ -284,29 +327,54 @@ class Writer(Reader):
 
         """
         len_new = min(voltage.size, current.size)
+        len_old = self.ds_voltage.shape[0]
 
         if isinstance(timestamp, float):
             timestamp = int(timestamp)
-        if isinstance(timestamp, int):
-            time_series_ns = self.sample_interval_ns * np.arange(len_new).astype("u8")
-            timestamp += time_series_ns
-        if isinstance(timestamp, np.ndarray):
-            len_new = min(len_new, timestamp.size)
+        if self.is_timeless:
+            # only the first timestamp is kept, sampling is assumed to be continuous
+            if isinstance(timestamp, np.ndarray):
+                len_new = min(len_new, timestamp.size)
+                self._warn_for_gaps(timestamp[:len_new], len_old)
+                timestamp = int(timestamp[0]) if timestamp.size > 0 else 0
+            if not isinstance(timestamp, int):
+                raise TypeError("timestamp-data was not usable")
+            if len_old == 0:
+                self.store_time_start(timestamp)
+            else:
+                self._warn_for_gaps(np.array([timestamp], dtype="u8"), len_old)
         else:
-            raise TypeError("timestamp-data was not usable")
-
-        len_old = self.ds_voltage.shape[0]
-
-        # resize dataset
-        self.ds_time.resize((len_old + len_new,))
+            if isinstance(timestamp, int):
+                time_series_ns = self.sample_interval_ns * np.arange(len_new).astype("u8")
+                timestamp += time_series_ns
+            if isinstance(timestamp, np.ndarray):
+                len_new = min(len_new, timestamp.size)
+            else:
+                raise TypeError("timestamp-data was not usable")
+            self.ds_time.resize((len_old + len_new,))
+            self.ds_time[len_old : len_old + len_new] = timestamp[:len_new]
+
+        # resize dataset & append new data
         self.ds_voltage.resize((len_old + len_new,))
         self.ds_current.resize((len_old + len_new,))
-
-        # append new data
-        self.ds_time[len_old : len_old + len_new] = timestamp[:len_new]
         self.ds_voltage[len_old : len_old + len_new] = voltage[:len_new]
         self.ds_current[len_old : len_old + len_new] = current[:len_new]
 
+    def _warn_for_gaps(self, timestamps: np.ndarray, len_old: int) -> None:
+        """Timeless files can't represent gaps in time -> inform user (once)."""
+        if self._gaps_warned or timestamps.size < 1:
+            return
+        interval = self.ds_time.interval
+        gaps = len_old > 0 and int(timestamps[0]) != self.ds_time.start + len_old * interval
+        if not gaps and timestamps.size > 1:
+            gaps = bool(np.any(np.diff(timestamps.astype("i8")) != interval))
+        if gaps:
+            self._logger.warning(
+                "Timestamps are not continuous, timeless file will lose these gaps (%s)",
+                self.file_path.name,
+            )
+            self._gaps_warned = True
+
     def append_iv_data_si(
         self,
         timestamp: np.ndarray | float,
@@ -346,7 +414,8 @@ class Writer(Reader):
                 "aligning with chunk-size, discarding last %d entries",
                 self.ds_voltage.size - size_new,
             )
-            self.ds_time.resize((size_new,))
+            if not self.is_timeless:
+                self.ds_time.resize((size_new,))
             self.ds_voltage.resize((size_new,))
             self.ds_current.resize((size_new,))
 
@@ -354,6 +423,13 @@ class Writer(Reader):
         """Conveniently store relevant key-value data (attribute) in H5-structure."""
         self.h5file.attrs.__setitem__(key, item)
 
+    def store_time_start(self, timestamp: int) -> None:
+        """Set first (raw) timestamp of a timeless file, following ones get derived from it."""
+        if not self.is_timeless:
+            raise ValueError("Only timeless files store a separate start-timestamp")
+        self.h5file["data"].attrs["time_start"] = timestamp
+        self.ds_time.start = timestamp
+
     def store_config(self, data: Mapping | ShpModel) -> None:
         """Get a better self-describing Output-File.
 
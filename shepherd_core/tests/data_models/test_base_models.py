@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from pathlib import Path
 
 import numpy as np
@@ -12,6 +13,7 @@ from shepherd_core.data_models.base.calibration import CalibrationPair
 from shepherd_core.data_models.base.calibration import CalibrationSeries
 from shepherd_core.data_models.base.calibration import CapeData
 from shepherd_core.data_models.base.content import ContentModel
+from shepherd_core.data_models.base.shepherd import ShpModel
 
 
 def test_base_model_cape_data() -> None:
@@ -78,6 +80,34 @@ def test_base_model_cal_cape_bytestr_with_cape_data() -> None:
     assert cal1.get_hash() == cal2.get_hash()
 
 
+def test_base_model_hash_memoized() -> None:
+    cal1 = CalibrationPair(gain=4.9)
+    hash1 = cal1.get_hash()
+    assert cal1.get_hash() == hash1
+    assert cal1 == CalibrationPair(gain=4.9)
+    cal2 = cal1.model_copy(update={"gain": 5.0})
+    assert cal2.get_hash() != hash1
+    assert cal2.get_hash() == CalibrationPair(gain=5.0).get_hash()
+
+
+class _GainModel(ShpModel):
+    gain: float
+
+    @cached_property
+    def gain_doubled(self) -> float:
+        return 2 * self.gain
+
+
+def test_base_model_copy_drops_cached_properties() -> None:
+    model1 = _GainModel(gain=1.0)
+    hash1 = model1.get_hash()
+    assert model1.gain_doubled == 2.0
+    model2 = model1.model_copy(update={"gain": 3.0})
+    assert model2.gain_doubled == 6.0
+    assert model2.get_hash() != hash1
+    assert model1.model_copy().gain_doubled == 2.0
+
+
 def test_base_model_cal_cape_example(tmp_path: Path) -> None:
     cal0 = CalMeasurementCape()
     path1 = Path(__file__).resolve().with_name("example_cal_data.yaml")
@@ -1,6 +1,8 @@
+import json
 from pathlib import Path
 
 import pytest
+import ryaml
 from pydantic import ValidationError
 from shepherd_core.data_models.content import EnergyDType
 from shepherd_core.data_models.content import EnergyEnvironment
@@ -47,6 +49,15 @@ def test_content_model_energy_profile_autocast() -> None:
     )
 
 
+def test_content_model_energy_profile_hashable() -> None:
+    ep1 = EnergyProfile(data_path="./file", data_type="ivcurve", duration=999, energy_Ws=3.1)
+    ep2 = EnergyProfile(data_path="./file", data_type="ivcurve", duration=999, energy_Ws=3.1)
+    ep3 = EnergyProfile(data_path="./file", data_type="ivcurve", duration=999, energy_Ws=3.2)
+    assert ep1 is not ep2
+    assert hash(ep1) == hash(ep2)
+    assert len({ep1, ep2, ep3}) == 2
+
+
 def test_content_model_energy_profile_derive_from_file(data_h5: Path) -> None:
     ep = EnergyProfile.derive_from_file(data_h5)
     assert ep.check() is True
@@ -66,6 +77,7 @@ def test_content_model_energy_profile_export_file(
     assert not ep_file.exists()
     energy_profiles[0].export(ep_file)
     assert ep_file.exists()
+    assert ep_file.read_bytes() == energy_profiles[0].data_path.read_bytes()
 
 
 def test_content_model_energy_profile_export_path(
@@ -164,6 +176,9 @@ def test_content_model_energy_environment_add_profiles(
     )
     ee2 = ee1 + energy_profiles
     assert len(ee2) == len(ee1) + len(energy_profiles)
+    profiles_mixed = [*energy_profiles, "not a profile"]
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = ee1 + profiles_mixed
 
 
 def test_content_model_energy_environment_add_env(energy_profiles: list[EnergyProfile]) -> None:
@@ -361,6 +376,110 @@ def test_content_model_energy_environment_get_slice_no_rep(
         assert len(ee1[sli].energy_profiles) == len(list(range(ep_len))[sli])
 
 
+def test_content_model_energy_environment_get_slice_copy(
+    energy_profiles: list[EnergyProfile],
+) -> None:
+    ee1 = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+        metadata={"weather": "sunny"},
+    )
+    ee2 = ee1[1:]
+    assert ee2.id != ee1.id
+    assert ee2.energy_profiles == energy_profiles[1:]
+    assert ee2.energy_profiles is not ee1.energy_profiles
+    assert len(ee2.modifications) == len(ee1.modifications) + 1
+    assert len(ee1.energy_profiles) == len(energy_profiles)
+    for ee_derived in (ee2, ee1 + energy_profiles[0], ee1 + energy_profiles):
+        assert ee_derived.metadata == ee1.metadata
+        assert ee_derived.metadata is not ee1.metadata
+        assert ee_derived.modifications is not ee1.modifications
+    ee2.metadata["weather"] = "rainy"
+    assert ee1.metadata["weather"] == "sunny"
+
+
+def test_content_model_energy_environment_cache_not_inherited(
+    energy_profiles: list[EnergyProfile],
+) -> None:
+    ep = EnergyProfile(
+        data_path=Path("./file"),
+        data_type=EnergyDType.isc_voc,
+        duration=1000,
+        energy_Ws=0.1,
+    )
+    ee1 = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=[ep, *energy_profiles],
+        owner="jane",
+        group="wayne",
+    )
+    assert ee1.duration < 1000
+    assert ee1[:1].duration == 1000
+    assert not ee1.valid
+    assert ee1[1:].valid
+
+
+def test_content_model_energy_environment_cache_not_copied(
+    energy_profiles: list[EnergyProfile],
+) -> None:
+    ep = EnergyProfile(
+        data_path=Path("./file"),
+        data_type=EnergyDType.isc_voc,
+        duration=1000,
+        energy_Ws=0.1,
+        repetitions_ok=True,
+    )
+    ee1 = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=[ep],
+        owner="jane",
+        group="wayne",
+    )
+    assert ee1.duration == 1000
+    assert ee1.repetitions_ok
+    ee2 = ee1.model_copy(update={"energy_profiles": [ep, *energy_profiles]})
+    assert ee2.duration < 1000
+    assert not ee2.repetitions_ok
+
+
+def test_content_model_energy_environment_valid_after_copy(
+    energy_profiles: list[EnergyProfile],
+) -> None:
+    ee1 = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    assert ee1.valid
+    ep_invalid = energy_profiles[0].model_copy(update={"valid": False})
+    ee2 = ee1.model_copy(update={"energy_profiles": [ep_invalid]})
+    assert not ee2.valid
+    with pytest.raises(ValueError):  # noqa: PT011
+        ee2.enforce_validity()
+
+
+def test_content_model_energy_environment_get_direct(
+    energy_profiles: list[EnergyProfile],
+) -> None:
+    ee1 = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    assert ee1.get_profile(1) == ee1[1]
+    assert ee1.get_slice(slice(1, None)).energy_profiles == ee1[1:].energy_profiles
+    assert ee1[True] == ee1[1]
+
+
 def test_content_model_energy_environment_export(
     tmp_path: Path, energy_profiles: list[EnergyProfile]
 ) -> None:
@@ -377,6 +496,14 @@ def test_content_model_energy_environment_export(
     ee.export(ee_path)
     assert ee_path.exists()
     assert len(list(ee_path.iterdir())) == len(energy_profiles) + 1
+    with (ee_path / "eenv.yaml").open(encoding="utf-8") as file:
+        content = ryaml.load(file)
+    for profile in content["energy_profiles"]:
+        assert Path(profile["data_path"]).parent == ee_path
+        assert Path(profile["data_path"]).exists()
+    ee_loaded = EnergyEnvironment(**content)
+    assert ee_loaded.id == ee.id
+    assert len(ee_loaded.energy_profiles) == len(ee.energy_profiles)
     # Fail because dir does already exist
     ee_path = tmp_path / "ee5678"
     ee_path.mkdir()
@@ -385,6 +512,41 @@ def test_content_model_energy_environment_export(
         ee.export(ee_path)
 
 
+def test_content_model_energy_environment_export_empty(
+    tmp_path: Path, energy_profiles: list[EnergyProfile]
+) -> None:
+    ee = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    ee_path = tmp_path / "ee1234"
+    ee[2:2].export(ee_path)
+    assert [path.name for path in ee_path.iterdir()] == ["eenv.yaml"]
+
+
+def test_content_model_energy_environment_export_json(
+    tmp_path: Path, energy_profiles: list[EnergyProfile]
+) -> None:
+    ee_path = tmp_path / "ee1234"
+    ee = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    ee.export(ee_path, use_json=True)
+    assert len(list(ee_path.iterdir())) == len(energy_profiles) + 1
+    content = json.loads((ee_path / "eenv.json").read_text(encoding="utf-8"))
+    for profile in content["energy_profiles"]:
+        assert Path(profile["data_path"]).parent == ee_path
+        assert Path(profile["data_path"]).exists()
+    assert EnergyEnvironment(**content).id == ee.id
+
+
 def test_content_model_energy_environment_check(data_h5: Path) -> None:
     ep = EnergyProfile.derive_from_file(data_h5)
     assert ep.check() is True
@@ -398,6 +560,47 @@ def test_content_model_energy_environment_check(data_h5: Path) -> None:
     )
     assert ee.check()
     assert ee.valid
+    ep_off = ep.model_copy(update={"energy_Ws": 2 * ep.energy_Ws})
+    assert not (ee + ep_off).check()  # shares file with the valid profiles
+
+
+def test_content_model_energy_environment_exists(
+    energy_profiles: list[EnergyProfile], tmp_path: Path
+) -> None:
+    ee = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    assert ee.exists()
+    ep_dir = energy_profiles[0].model_copy(update={"data_path": tmp_path})
+    assert not (ee + ep_dir).check()  # directory is no file
+    ep_missing = energy_profiles[0].model_copy(update={"data_path": tmp_path / "xyz" / "a.h5"})
+    assert not (ee + ep_missing).exists()
+    assert not (ee + ep_missing).check()
+
+
+def test_content_model_energy_environment_exists_broken_link(
+    energy_profiles: list[EnergyProfile], tmp_path: Path
+) -> None:
+    ee = EnergyEnvironment(
+        id=98765,
+        name="some",
+        energy_profiles=energy_profiles,
+        owner="jane",
+        group="wayne",
+    )
+    path_link = tmp_path / "link.h5"
+    try:
+        path_link.symlink_to(tmp_path / "missing.h5")
+    except OSError:
+        pytest.skip("symlinks not supported")
+    ep_link = energy_profiles[0].model_copy(update={"data_path": path_link})
+    assert not ep_link.exists()
+    assert not (ee + ep_link).exists()
+    assert not (ee + ep_link).check()
 
 
 # ############################ Firmware
@@ -32,6 +32,13 @@ def test_reader_items(data_h5: Path) -> None:
             _ = sfr["non-existing"]
 
 
+def test_reader_chunk_cache(data_h5: Path) -> None:
+    with Reader(data_h5, verbose=False, chunk_cache_bytes=64 * 2**20) as sfr:
+        _, _, cache_bytes, _ = sfr.h5file.id.get_access_plist().get_cache()
+        assert cache_bytes == 64 * 2**20
+        assert sfr.energy() > 0
+
+
 def test_reader_open(tmp_path: Path) -> None:
     with pytest.raises(ValidationError):
         Reader(file_path=None)
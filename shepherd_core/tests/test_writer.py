@@ -1,3 +1,4 @@
+import logging
 import math
 from pathlib import Path
 
@@ -68,6 +69,71 @@ def test_writer_basics(h5_path: Path) -> None:
 
 def test_writer_compression_1(h5_path: Path) -> None:
     generate_shp_file(h5_path, compression=Compression.gzip1)
+    with Reader(h5_path, verbose=False) as file:
+        assert file.ds_voltage.compression == "gzip"
+        assert file.ds_voltage.shuffle
+
+
+def test_writer_compression_blosc(h5_path: Path) -> None:
+    hdf5plugin = pytest.importorskip("hdf5plugin")
+    generate_shp_file(h5_path, compression=Compression.blosc_lz4)
+    with Reader(h5_path, verbose=False) as file:
+        plist = file.ds_voltage.id.get_create_plist()
+        filters = {plist.get_filter(_i)[0] for _i in range(plist.get_nfilters())}
+        assert hdf5plugin.BLOSC_ID in filters
+        assert file.ds_voltage[-1] > 0
+
+
+def test_writer_chunk_samples(h5_path: Path) -> None:
+    with Writer(h5_path, chunk_samples=250_000) as file:
+        assert file.ds_voltage.chunks == (250_000,)
+        assert file.ds_current.chunks == (250_000,)
+
+
+def test_writer_chunk_samples_unaligned(h5_path: Path) -> None:
+    with pytest.raises(ValueError):  # noqa: PT011
+        Writer(h5_path, chunk_samples=12_345)
+
+
+def test_writer_timeless(tmp_path: Path) -> None:
+    path_full = generate_shp_file(tmp_path / "full.h5")
+    path_less = tmp_path / "timeless.h5"
+    with Reader(path_full, verbose=False) as src, Writer(path_less, timeless=True) as dst:
+        for ts, vs, cs in src.read(is_raw=True):
+            dst.append_iv_data_raw(ts, vs, cs)
+    with Reader(path_full, verbose=False) as full, Reader(path_less, verbose=False) as less:
+        assert less.is_timeless
+        assert not full.is_timeless
+        assert less.is_valid()
+        assert less.samples_n == full.samples_n
+        assert less.samplerate_sps == full.samplerate_sps
+        assert less.get_time_start() == full.get_time_start()
+        assert less.h5file["data"]["time"].shape[0] == 0
+        for (t_l, v_l, _), (t_f, v_f, _) in zip(less.read(), full.read(), strict=True):
+            assert np.allclose(t_l, t_f)
+            assert np.array_equal(v_l, v_f)
+        assert int(less.ds_time[-1]) == int(full.ds_time[-1])
+        assert less.file_size < full.file_size
+
+
+def test_writer_timeless_modify_fail(h5_file: Path) -> None:
+    with pytest.raises(ValueError, match="timeless"):
+        Writer(h5_file, modify_existing=True, timeless=True)
+
+
+def test_writer_timeless_gaps_warn(h5_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    data = np.zeros(100, dtype="u4")
+    with Writer(h5_path, timeless=True) as file, caplog.at_level(logging.WARNING):
+        interval = file.sample_interval_ns
+        file.append_iv_data_raw(interval * np.arange(100, dtype="u8"), data, data)
+        assert "not continuous" not in caplog.text
+        file.append_iv_data_raw(interval * np.arange(150, 250, dtype="u8"), data, data)
+        assert "not continuous" in caplog.text
+
+
+def test_writer_timeless_start_fail(h5_path: Path) -> None:
+    with Writer(h5_path) as file, pytest.raises(ValueError):  # noqa: PT011
+        file.store_time_start(1234)
 
 
 def test_writer_unique_path(h5_file: Path) -> None:
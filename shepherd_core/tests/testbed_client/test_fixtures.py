@@ -1,9 +1,14 @@
+import pickle
+from pathlib import Path
+
 import pytest
 from shepherd_core.data_models.content import content_supported
 from shepherd_core.data_models.content import instantiate_content
 from shepherd_core.data_models.testbed import components_supported
 from shepherd_core.data_models.testbed import instantiate_component
+from shepherd_core.testbed_client import fixtures
 from shepherd_core.testbed_client import tb_client
+from shepherd_core.testbed_client.fixtures import Fixture
 from shepherd_core.testbed_client.fixtures import Fixtures
 
 
@@ -25,6 +30,27 @@ def test_fixtures_visibility(model_type: str) -> None:
         assert model_data.get("group") is not None
 
 
+def test_fixtures_pickle_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fixtures, "cache_user_path", tmp_path)
+    monkeypatch.setattr(fixtures, "pickle_cache_enabled", lambda: True)
+    fix1 = Fixtures()
+    assert (tmp_path / "fixtures.pickle").exists()
+    fix2 = Fixtures()
+    assert fix1.keys() == fix2.keys()
+    with (tmp_path / "fixtures.pickle").open("wb") as fd:
+        pickle.dump((("outdated", []), {}), fd)
+    fix3 = Fixtures()
+    assert fix1.keys() == fix3.keys()
+
+
+def test_fixtures_pickle_cache_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fixtures, "cache_user_path", tmp_path)
+    monkeypatch.setattr(fixtures, "pickle_cache_enabled", lambda: False)
+    fix = Fixtures()
+    assert len(fix.keys()) > 0
+    assert not (tmp_path / "fixtures.pickle").exists()
+
+
 def test_fixtures_are_components_or_content() -> None:
     c_and_c = set(content_supported.keys()) | set(components_supported.keys())
     fixture_types = tb_client.list_resource_types()
@@ -63,3 +89,36 @@ def test_fixtures_instantiate_components(model_type: str) -> None:
         model_data = tb_client.get_resource_item(model_type, name=content_name)
         model = instantiate_component(model_type, model_data)
         assert model is not None
+
+
+def test_fixture_inheritance_circle_detected() -> None:
+    fix = Fixture("dummy")
+    fix.insert_raw({"name": "a", "inherit_from": "b"})
+    fix.insert_raw({"name": "b", "inherit_from": "a"})
+    with pytest.raises(ValueError, match="Circle"):
+        fix.inheritance({"name": "c", "inherit_from": "a"})
+
+
+def test_fixture_inheritance_memo_invalidated() -> None:
+    fix = Fixture("dummy")
+    fix.insert_raw({"name": "base", "value": 1})
+    fix.insert_raw({"name": "child", "inherit_from": "base"})
+    values, chain = fix.inheritance({"name": "x", "inherit_from": "child"})
+    assert values["value"] == 1
+    assert chain == ["x", "child", "base"]
+    fix.insert_raw({"name": "base", "value": 2})
+    values, _ = fix.inheritance({"name": "x", "inherit_from": "child"})
+    assert values["value"] == 2
+    fix_copy = pickle.loads(pickle.dumps(fix))
+    assert fix_copy.inheritance({"name": "x", "inherit_from": "child"}) == (values, chain)
+
+
+def test_fixture_inheritance_independent_of_memo() -> None:
+    fix = Fixture("dummy")
+    fix.insert_raw({"name": "base", "value": 1})
+    fix.insert_raw({"name": "child", "inherit_from": "base"})
+    request = {"name": "base", "inherit_from": "child"}
+    result_empty = fix.inheritance(request)
+    assert result_empty[1] == ["base", "child", "base"]
+    fix.inheritance({"name": "x", "inherit_from": "child"})  # fills memo
+    assert fix.inheritance(request) == result_empty